@@ -1,4 +1,4 @@
-"""This module provides functions to generate 2D and 3D scatter plots from operational domain data stored in CSV files."""
+"""This module provides functions to generate 2D and 3D scatter plots from operational domain data stored in CSV format."""
 
 from __future__ import annotations
 
@@ -10,6 +10,7 @@ import pandas as pd
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
+    from typing import TextIO
 
 # Define colors
 GRAY = np.array([0.75, 0.75, 0.75])  # RGB for gray
@@ -24,11 +25,11 @@ _LATEX_LABELS: Mapping[str, str] = {
 }
 
 
-def load_data(csv_files: list[str]) -> tuple[list[pd.DataFrame], list[pd.DataFrame]]:
+def load_data(csv_files: list[str | TextIO]) -> tuple[list[pd.DataFrame], list[pd.DataFrame]]:
     """Load data from CSV files and separate into operational and non-operational datasets.
 
     Args:
-        csv_files (List[str]): List of paths to CSV files.
+        csv_files (List[str | TextIO]): List of paths to CSV files or in-memory text buffers holding CSV data.
 
     Returns:
         Tuple[List[pd.DataFrame], List[pd.DataFrame]]: Two lists containing operational and non-operational data for X, Y, and Z axes, respectively.
@@ -159,7 +160,7 @@ def plot_data(
 
 
 def generate_plot(
-    csv_files: list[str],
+    csv_files: list[str | TextIO],
     x_param: str,
     y_param: str,
     z_param: str | None = None,
@@ -180,7 +181,8 @@ def generate_plot(
     LaTeX labels for axis names, and can include both operational and non-operational data in the visualization.
 
     Args:
-       csv_files (List[str]): List of paths to CSV files containing operational and non-operational data.
+       csv_files (List[str | TextIO]): List of paths to CSV files or in-memory text buffers (e.g., `io.StringIO`)
+           containing operational and non-operational data.
        x_param (str): Name of the parameter to plot on the X-axis (e.g., 'epsilon_r').
        y_param (str): Name of the parameter to plot on the Y-axis (e.g., 'lambda_tf').
        z_param (str, optional): Name of the parameter to plot on the Z-axis for 3D plots. If not provided,
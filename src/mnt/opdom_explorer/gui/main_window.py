@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
 
 from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QDesktopServices, QKeyEvent, QPixmap
+from PyQt6.QtGui import QDesktopServices, QKeyEvent
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -34,24 +33,17 @@ class MainWindow(QMainWindow):
         self.bdl_input_iterator_presence_encoding = None
         self.current_signal_encoding = pyfiction.input_bdl_configuration.PERTURBER_DISTANCE_ENCODED
 
+        self.desired_width = 600  # Example width in pixels
+        self.desired_height = 600  # Example height in pixels
+
         self._init_ui()
         self.plot_view_active = True  # Start with the layout plot without charges
         self.current_file_name_label = QLabel(self)  # Label for displaying the file name
 
-        self.desired_width = 600  # Example width in pixels
-        self.desired_height = 600  # Example height in pixels
-
         self.icon_loader = IconLoader()
 
-        self.script_dir = Path(__file__).resolve().parent
-        self.caching_dir = self.script_dir / "widgets" / "caching"
-
-        # Remove the caching directory if it exists
-        if self.caching_dir.exists() and self.caching_dir.is_dir():
-            shutil.rmtree(self.caching_dir)  # This will delete the entire caching directory and its contents
-
     def _init_ui(self) -> None:
-        self.visualizer = LayoutVisualizer()
+        self.visualizer = LayoutVisualizer(target_size=max(self.desired_width, self.desired_height))
         self.plot_view_active = True
         self.setWindowTitle("Operational Domain Explorer")
         self.setGeometry(100, 100, 600, 400)
@@ -97,6 +89,11 @@ class MainWindow(QMainWindow):
             self.lyt, bdl_input_iterator_params_presence
         )
 
+        # The number of input pairs does not depend on the input signal encoding and is thus queried only once
+        self.num_input_pairs = self.bdl_input_iterator_distance_encoding.num_input_pairs()
+        # Binary representations of all input patterns, padded to the number of input pairs
+        bin_values = [f"{i:0{self.num_input_pairs}b}" for i in range(2**self.num_input_pairs)]
+
         # Create layout for display
         box_layout_view = QVBoxLayout()
 
@@ -124,7 +121,7 @@ class MainWindow(QMainWindow):
 
         # Create and configure QSlider
         self.slider = QSlider(Qt.Horizontal, self)
-        self.slider.setRange(0, 2 ** self.bdl_input_iterator_distance_encoding.num_input_pairs() - 1)
+        self.slider.setRange(0, 2**self.num_input_pairs - 1)
         self.slider.setTickInterval(1)  # Ticks at each integer position
         self.slider.setTickPosition(QSlider.TicksBelow)
 
@@ -204,10 +201,14 @@ class MainWindow(QMainWindow):
             self.min_pos,
             self.plot_label,
             self.slider.value(),
+            visualizer=self.visualizer,
         )
 
+        # Plots are named by input pattern and configuration only, so plots of a previously loaded layout are discarded
+        self.visualizer.clear_plots()
+
         # Generate plots for each slider value
-        for i in range(2 ** self.bdl_input_iterator_distance_encoding.num_input_pairs()):
+        for i, bin_value in enumerate(bin_values):
             _ = self.visualizer.visualize_layout(
                 lyt_original=self.lyt,
                 lyt=self.bdl_input_iterator_distance_encoding.get_layout(),
@@ -215,11 +216,11 @@ class MainWindow(QMainWindow):
                 bb_max=self.max_pos,
                 slider_value=i,
                 input_encoding="distance",
-                bin_value=f"{i:b}".zfill(self.bdl_input_iterator_distance_encoding.num_input_pairs()),
+                bin_value=bin_value,
             )
             self.bdl_input_iterator_distance_encoding += 1
 
-        for i in range(2 ** self.bdl_input_iterator_presence_encoding.num_input_pairs()):
+        for i, bin_value in enumerate(bin_values):
             _ = self.visualizer.visualize_layout(
                 lyt_original=self.lyt,
                 lyt=self.bdl_input_iterator_presence_encoding.get_layout(),
@@ -227,15 +228,12 @@ class MainWindow(QMainWindow):
                 bb_max=self.max_pos,
                 slider_value=i,
                 input_encoding="presence",
-                bin_value=f"{i:b}".zfill(self.bdl_input_iterator_presence_encoding.num_input_pairs()),
+                bin_value=bin_value,
             )
             self.bdl_input_iterator_presence_encoding += 1
 
-        # Construct the full path to the file
-        plot_image_path = self.caching_dir / f"lyt_plot_distance_{self.slider.value()}.svg"
-
-        # Load the image using QPixmap
-        pixmap = QPixmap(str(plot_image_path))  # Convert Path object to string
+        # Get the rendered plot of the current slider value
+        pixmap = self.visualizer.get_plot(self.visualizer.plot_name(self.slider.value(), "distance"))
         # Check if the pixmap was successfully loaded
         if not pixmap.isNull():
             # Resize and set the pixmap to the QLabel
@@ -281,17 +279,20 @@ class MainWindow(QMainWindow):
                 if self.current_signal_encoding == pyfiction.input_bdl_configuration.PERTURBER_DISTANCE_ENCODED
                 else "presence"
             )
-            # Construct the full path to the file
-            plot_image_path = self.caching_dir / f"lyt_plot_{encoding}_{self.slider.value()}.svg"
-
-            self.pixmap = QPixmap(str(plot_image_path))
+            self.pixmap = self.visualizer.get_plot(self.visualizer.plot_name(self.slider.value(), encoding))
         else:
-            x, y = self.plot.picked_x_y()
-            # Construct the full path to the file
-            plot_image_path = self.caching_dir / f"lyt_plot_{self.slider.value()}_x_{x}_y_{y}.svg"
+            # Render the simulation result of this input pattern in case it has not been plotted yet
+            pixmap = self.plot.render_pending_frame(value)
+            if pixmap is None:
+                pixmap = self.visualizer.get_plot(
+                    self.visualizer.plot_name(self.slider.value(), simulation_key=self.plot.simulation_key)
+                )
+
+            if pixmap.isNull():
+                # The input pattern is still being simulated; the plot widget shows it once the result is ready
+                return
 
-            # Load the image using QPixmap
-            self.pixmap = QPixmap(str(plot_image_path))
+            self.pixmap = pixmap
 
         self.pixmap = self.pixmap.scaled(
             self.desired_width, self.desired_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
@@ -323,6 +324,7 @@ class MainWindow(QMainWindow):
             self.min_pos,
             self.plot_label,
             self.slider.value(),
+            visualizer=self.visualizer,
         )
 
         # Store the QSplitter widget in a class variable
@@ -356,11 +358,8 @@ class MainWindow(QMainWindow):
             else "presence"
         )
 
-        # Construct the full path to the plot image file based on the slider value
-        plot_image_path = self.caching_dir / f"lyt_plot_{input_encoding}_{self.slider.value()}.svg"
-
-        # Load the image using QPixmap
-        self.pixmap = QPixmap(str(plot_image_path))
+        # Get the rendered plot of the current slider value
+        self.pixmap = self.visualizer.get_plot(self.visualizer.plot_name(self.slider.value(), input_encoding))
 
         self.pixmap = self.pixmap.scaled(
             self.desired_width, self.desired_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
@@ -51,8 +51,7 @@ class IconGroupBox(QGroupBox):
 
         # Create a group box to contain the actual content
         self.group_box = QGroupBox()
-        group_box_layout = QVBoxLayout()
-        self.group_box.setLayout(group_box_layout)  # Set the layout directly here
+        self._content_layout = QVBoxLayout(self.group_box)  # Installed on the content group box right away
         layout.addWidget(self.group_box)
 
     def add_widget(self, widget: QWidget) -> None:
@@ -61,7 +60,7 @@ class IconGroupBox(QGroupBox):
         Args:
             widget (QWidget): The widget to add.
         """
-        self.group_box.layout().addWidget(widget)
+        self._content_layout.addWidget(widget)
 
     def add_layout(self, layout: QLayout) -> None:
         """Add a layout to the group box's layout.
@@ -69,4 +68,4 @@ class IconGroupBox(QGroupBox):
         Args:
             layout (QLayout): The layout to add.
         """
-        self.group_box.layout().addLayout(layout)
+        self._content_layout.addLayout(layout)
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import qtawesome as qta
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QByteArray, Qt
 from PyQt6.QtGui import QColor, QIcon, QPainter, QPixmap
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtSvgWidgets import QSvgWidget
@@ -22,6 +22,11 @@ class IconLoader:
     library can be browsed here: https://pictogrammers.com/library/mdi/
     """
 
+    # Icons that have already been loaded, keyed by icon name and color; shared by all icon loader instances
+    _icon_cache: ClassVar[dict[tuple[str, str], QIcon]] = {}
+    # Contents of the SVG logos that have already been read, keyed by file path; shared by all icon loader instances
+    _svg_cache: ClassVar[dict[Path, QByteArray]] = {}
+
     def __init__(self) -> None:
         """Initializes the icon loader by detecting the current dark/light mode setting of the application and setting the
         default colors for icons in light and dark mode.
@@ -68,7 +73,14 @@ class IconLoader:
             QIcon: The loaded icon from the qtawesome library.
         """
         color = color or self.get_icon_color()
-        return qta.icon(icon_name, color=color, **kwargs)
+        if kwargs:
+            return qta.icon(icon_name, color=color, **kwargs)
+
+        # Icons without additional options only depend on their name and color and are thus loaded only once
+        key = (icon_name, color.name(QColor.NameFormat.HexArgb))
+        if key not in self._icon_cache:
+            self._icon_cache[key] = qta.icon(icon_name, color=color)
+        return self._icon_cache[key]
 
     def svg_to_icon(self, svg_path: Path, size: tuple[int, int] = (128, 128)) -> QIcon:
         """Converts an SVG file to a QIcon."""
@@ -92,6 +104,23 @@ class IconLoader:
 
         return self.svg_to_icon(logo_path, size)
 
+    def _load_svg_widget(self, svg_path: Path) -> QSvgWidget:
+        """Creates an SVG widget displaying the given SVG file. The file is only read from disk the first time.
+
+        Args:
+            svg_path (Path): The path to the SVG file.
+
+        Returns:
+            QSvgWidget: The SVG widget displaying the file.
+        """
+        if svg_path not in self._svg_cache:
+            self._svg_cache[svg_path] = QByteArray(svg_path.read_bytes())
+
+        # Widgets cannot be shared between parents, so only the file contents are reused
+        svg_widget = QSvgWidget()
+        svg_widget.load(self._svg_cache[svg_path])
+        return svg_widget
+
     def load_mnt_logo(self) -> QSvgWidget:
         """Loads the MNT logo from an SVG file in the resources folder.
 
@@ -106,7 +135,7 @@ class IconLoader:
             msg = f"MNT logo not found at {logo_path}"
             raise FileNotFoundError(msg)
 
-        return QSvgWidget(str(logo_path))
+        return self._load_svg_widget(logo_path)
 
     def load_tum_logo(self) -> QSvgWidget:
         """Loads the TUM logo from an SVG file in the resources folder.
@@ -120,7 +149,7 @@ class IconLoader:
             msg = f"TUM logo not found at {logo_path}"
             raise FileNotFoundError(msg)
 
-        return QSvgWidget(str(logo_path))
+        return self._load_svg_widget(logo_path)
 
     def load_settings_icon(self, color: QColor = None) -> QIcon:
         """Loads the settings icon.
@@ -2,10 +2,32 @@
 
 from __future__ import annotations
 
+from functools import cache
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QSize
 from PyQt6.QtWidgets import QLabel, QWidget
 
 from .icon_loader import IconLoader
 
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QPixmap
+
+
+@cache
+def _load_help_pixmap(icon_size: tuple[int, int], device_pixel_ratio: float) -> QPixmap:
+    """Loads and rasterizes the help icon once per size and device pixel ratio and shares it among all InfoTag
+    instances. The icon is rasterized at the device resolution so that it does not need to be scaled when painted.
+
+    Args:
+        icon_size (Tuple[int, int]): The size of the icon in device-independent pixels.
+        device_pixel_ratio (float): The device pixel ratio of the screen the icon is displayed on.
+
+    Returns:
+        QPixmap: The rasterized help icon.
+    """
+    return IconLoader().load_help_icon().pixmap(QSize(*icon_size), device_pixel_ratio)
+
 
 class InfoTag(QLabel):
     """An InfoTag is a QLabel that displays a help icon and provides a tooltip when hovered over."""
@@ -19,5 +41,5 @@ class InfoTag(QLabel):
             parent (QWidget, optional): The parent widget.
         """
         super().__init__(parent)
-        self.setPixmap(IconLoader().load_help_icon().pixmap(*icon_size))
+        self.setPixmap(_load_help_pixmap(tuple(icon_size), self.devicePixelRatioF()))
         self.setToolTip(tooltip_text)
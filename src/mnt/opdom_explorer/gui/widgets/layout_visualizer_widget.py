@@ -1,25 +1,256 @@
 from __future__ import annotations
 
-from pathlib import Path
+from io import BytesIO
 from typing import TYPE_CHECKING, Literal
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
+from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import QWidget
 
 from mnt import pyfiction
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from matplotlib.axes import Axes
+    from matplotlib.collections import PathCollection
+
+# Edge length of the (square) layout plot figure in inches
+_FIG_SIZE = 12
+
+# Default resolution of the rendered layout plots and the bounds of the resolution adapted to a target size
+_PLOT_DPI = 150
+_MIN_PLOT_DPI = 72
+_MAX_PLOT_DPI = 200
 
 
 class LayoutVisualizer(QWidget):
-    def __init__(self) -> None:
+    def __init__(self, target_size: int | None = None) -> None:
+        """Initializes the layout visualizer.
+
+        Args:
+            target_size: Optional size in pixels at which the rendered plots are displayed. If given, the plot resolution
+                is adapted to it instead of using the default resolution.
+        """
         super().__init__()
 
-    @staticmethod
+        # Render no more pixels than are displayed
+        self.dpi = (
+            _PLOT_DPI if target_size is None else min(max(target_size // _FIG_SIZE, _MIN_PLOT_DPI), _MAX_PLOT_DPI)
+        )
+
+        # A single figure is reused (and cleared) for every rendered layout plot. It is attached to an Agg canvas
+        # explicitly so that savefig reuses the canvas and its renderer instead of creating new ones for every plot.
+        self.fig = Figure(figsize=(_FIG_SIZE, _FIG_SIZE), dpi=self.dpi)
+        FigureCanvasAgg(self.fig)
+        self.fig.patch.set_facecolor("#2d333b")
+        self.ax = self.fig.add_subplot()
+
+        # Rendered layout plots as PNG data, keyed by plot name
+        self.plots: dict[str, bytes] = {}
+        # nm X positions per grid column and nm Y positions per grid row, keyed by the bounding box they were computed for
+        self._grid_nm_axes: dict[tuple[int, int, int, int], tuple[np.ndarray, np.ndarray]] = {}
+        # nm positions of the background grid points, keyed by the bounding box they were computed for
+        self._grid_nm_positions: dict[tuple[int, int, int, int], np.ndarray] = {}
+        # Background grid artist that is kept on the reused axes across plots of the same bounding box
+        self._grid_artist: PathCollection | None = None
+        self._grid_artist_key: tuple[int, int, int, int] | None = None
+        # BDL pairs of the original layout, keyed by cell type; only valid for _bdl_pairs_lyt
+        self._bdl_pairs_lyt: pyfiction.charge_distribution_surface_100 | None = None
+        self._bdl_pairs: dict[pyfiction.sidb_technology.cell_type, list[pyfiction.bdl_pair_100]] = {}
+        # nm positions of the (padded) upper and lower SiDBs of these BDL pairs, keyed by cell type and bounding box
+        self._bdl_pair_nm_positions: dict[tuple[pyfiction.sidb_technology.cell_type, tuple[int, ...]], np.ndarray] = {}
+
+    def _get_grid_nm_axes(
+        self,
+        lyt: pyfiction.charge_distribution_surface_100,
+        bb_min: pyfiction.offset_coordinate,
+        bb_max: pyfiction.offset_coordinate,
+        padding_x: int,
+        padding_y: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the nm X positions of all grid columns and the nm Y positions of all grid rows around the given
+        bounding box, starting at the bounding box's minimum.
+
+        On the H-Si(100)-2x1 lattice, the nm X position only depends on the grid column and the nm Y position only on
+        the grid row. Hence, one pyfiction call per column and per row suffices to locate every grid point. Note that
+        the Y positions are not affine in the row index because of the dimer pairs, which is why they are queried
+        rather than extrapolated.
+
+        Args:
+            lyt: Layout whose lattice is used to compute the nm positions.
+            bb_min: Minimum grid position of the bounding box.
+            bb_max: Maximum grid position of the bounding box.
+            padding_x: Padding in X direction around the bounding box.
+            padding_y: Padding in Y direction around the bounding box.
+
+        Returns:
+            The nm X positions per column and the nm Y positions per row.
+        """
+        key = (bb_min.x, bb_min.y, bb_max.x, bb_max.y)
+
+        if key not in self._grid_nm_axes:
+            xs = range(bb_min.x, bb_max.x + padding_x * 2 + 1)
+            ys = range(bb_min.y, bb_max.y + padding_y * 3)
+
+            # Reuse a single coordinate object for all queries instead of allocating one per column and row
+            coord = pyfiction.offset_coordinate(xs.start, ys.start)
+
+            nm_x = np.empty(len(xs))
+            for i, x in enumerate(xs):
+                coord.x = x
+                nm_x[i] = pyfiction.sidb_nm_position(lyt, coord)[0]
+
+            coord.x = xs.start
+            nm_y = np.empty(len(ys))
+            for i, y in enumerate(ys):
+                coord.y = y
+                nm_y[i] = pyfiction.sidb_nm_position(lyt, coord)[1]
+
+            self._grid_nm_axes[key] = (nm_x, nm_y)
+
+        return self._grid_nm_axes[key]
+
+    def _get_grid_nm_positions(
+        self,
+        lyt: pyfiction.charge_distribution_surface_100,
+        bb_min: pyfiction.offset_coordinate,
+        bb_max: pyfiction.offset_coordinate,
+        padding_x: int,
+        padding_y: int,
+    ) -> np.ndarray:
+        """Returns the nm positions of all background grid points around the given bounding box. The positions only
+        depend on the lattice and the bounding box and are therefore computed once and reused for subsequent plots.
+
+        Args:
+            lyt: Layout whose lattice is used to compute the nm positions.
+            bb_min: Minimum grid position of the bounding box.
+            bb_max: Maximum grid position of the bounding box.
+            padding_x: Padding in X direction around the bounding box.
+            padding_y: Padding in Y direction around the bounding box.
+
+        Returns:
+            An (N, 2) array of the nm positions of all grid points.
+        """
+        key = (bb_min.x, bb_min.y, bb_max.x, bb_max.y)
+
+        if key not in self._grid_nm_positions:
+            nm_x, nm_y = self._get_grid_nm_axes(lyt, bb_min, bb_max, padding_x, padding_y)
+
+            grid_x, grid_y = np.meshgrid(nm_x, nm_y, indexing="ij")
+            self._grid_nm_positions[key] = np.column_stack((grid_x.ravel(), grid_y.ravel()))
+
+        return self._grid_nm_positions[key]
+
+    def _get_cell_nm_positions(
+        self,
+        lyt: pyfiction.charge_distribution_surface_100,
+        coords: np.ndarray,
+        bb_min: pyfiction.offset_coordinate,
+        bb_max: pyfiction.offset_coordinate,
+        padding_x: int,
+        padding_y: int,
+    ) -> np.ndarray:
+        """Returns the nm positions of the given grid coordinates. Coordinates within the background grid are looked up
+        vectorized from the cached grid axes; only coordinates outside of it require a pyfiction call.
+
+        Args:
+            lyt: Layout whose lattice is used to compute the nm positions.
+            coords: An (N, 2) integer array of (padded) grid coordinates.
+            bb_min: Minimum grid position of the bounding box.
+            bb_max: Maximum grid position of the bounding box.
+            padding_x: Padding in X direction around the bounding box.
+            padding_y: Padding in Y direction around the bounding box.
+
+        Returns:
+            An (N, 2) array of the nm positions of the given coordinates.
+        """
+        nm_x, nm_y = self._get_grid_nm_axes(lyt, bb_min, bb_max, padding_x, padding_y)
+
+        col = coords[:, 0] - bb_min.x
+        row = coords[:, 1] - bb_min.y
+        on_grid = (col >= 0) & (col < len(nm_x)) & (row >= 0) & (row < len(nm_y))
+
+        nm_positions = np.empty((len(coords), 2))
+        nm_positions[on_grid, 0] = nm_x[col[on_grid]]
+        nm_positions[on_grid, 1] = nm_y[row[on_grid]]
+
+        coord = pyfiction.offset_coordinate()
+        for i in np.flatnonzero(~on_grid):
+            coord.x, coord.y = int(coords[i, 0]), int(coords[i, 1])
+            nm_positions[i] = pyfiction.sidb_nm_position(lyt, coord)
+
+        return nm_positions
+
+    def _get_bdl_pairs(
+        self, lyt_original: pyfiction.charge_distribution_surface_100, cell_type: pyfiction.sidb_technology.cell_type
+    ) -> list[pyfiction.bdl_pair_100]:
+        """Returns the BDL pairs of the given cell type in the original layout. The detected pairs are cached until a
+        different original layout is passed.
+
+        Args:
+            lyt_original: Original charge distribution layout.
+            cell_type: Type of the BDL pairs to detect (e.g., INPUT or OUTPUT).
+
+        Returns:
+            The detected BDL pairs.
+        """
+        if lyt_original is not self._bdl_pairs_lyt:
+            self._bdl_pairs_lyt = lyt_original
+            self._bdl_pairs = {}
+            self._bdl_pair_nm_positions = {}
+
+        if cell_type not in self._bdl_pairs:
+            self._bdl_pairs[cell_type] = pyfiction.detect_bdl_pairs(lyt_original, cell_type)
+
+        return self._bdl_pairs[cell_type]
+
+    def _get_bdl_pair_nm_positions(
+        self,
+        lyt: pyfiction.charge_distribution_surface_100,
+        lyt_original: pyfiction.charge_distribution_surface_100,
+        cell_type: pyfiction.sidb_technology.cell_type,
+        bb_min: pyfiction.offset_coordinate,
+        bb_max: pyfiction.offset_coordinate,
+        padding_x: int,
+        padding_y: int,
+    ) -> np.ndarray:
+        """Returns the nm positions of the (padded) upper and lower SiDBs of all BDL pairs of the given cell type in the
+        original layout. The positions do not depend on the input pattern or the charge distribution and are therefore
+        computed once per original layout and bounding box.
+
+        Args:
+            lyt: Layout whose lattice is used to compute the nm positions.
+            lyt_original: Original charge distribution layout.
+            cell_type: Type of the BDL pairs (e.g., INPUT or OUTPUT).
+            bb_min: Minimum grid position of the bounding box.
+            bb_max: Maximum grid position of the bounding box.
+            padding_x: Padding in X direction around the bounding box.
+            padding_y: Padding in Y direction around the bounding box.
+
+        Returns:
+            An (N, 2, 2) array holding the nm positions of the upper and lower SiDB of each of the N BDL pairs.
+        """
+        bdl_pairs = self._get_bdl_pairs(lyt_original, cell_type)
+        key = (cell_type, (bb_min.x, bb_min.y, bb_max.x, bb_max.y, padding_x, padding_y))
+
+        if key not in self._bdl_pair_nm_positions:
+            coords = np.array(
+                [(sidb.x, sidb.y) for pair in bdl_pairs for sidb in (pair.upper, pair.lower)], dtype=int
+            ).reshape(-1, 2)
+            coords += (padding_x, padding_y)
+
+            nm_positions = self._get_cell_nm_positions(lyt, coords, bb_min, bb_max, padding_x, padding_y)
+            self._bdl_pair_nm_positions[key] = nm_positions.reshape(-1, 2, 2)
+
+        return self._bdl_pair_nm_positions[key]
+
     def visualize_layout(
+        self,
         lyt_original: pyfiction.charge_distribution_surface_100,
         lyt: pyfiction.charge_distribution_surface_100,
         bb_min: pyfiction.offset_coordinate,
@@ -28,44 +259,30 @@ class LayoutVisualizer(QWidget):
         input_encoding: Literal["distance", "presence"] | None = None,
         charge_lyt: pyfiction.charge_distribution_surface_100 = None,
         operation_status: pyfiction.operational_status = None,
-        parameter_point: tuple[float, float] | None = None,
+        simulation_key: Hashable | None = None,
         bin_value: list[int] | None = None,
         kink_induced_operational_status: pyfiction.operational_status | None = None,
-    ) -> Path:
-        """Generates a plot based on the charge distribution layout.
+    ) -> QPixmap:
+        """Generates a plot based on the charge distribution layout. The plot is kept in memory and can be retrieved
+        again via get_plot.
 
         Args:
             lyt_original: Original charge distribution layout.
             lyt: Current charge distribution layout.
             bb_min: Minimum grid position for plotting.
             bb_max: Maximum grid position for plotting.
-            slider_value: Value of the slider to include in the plot filename.
+            slider_value: Value of the slider to include in the plot name.
             input_encoding: Optional input signal encoding type for the layout (e.g., "distance", "presence").
             charge_lyt: Optional charge distribution layout for charges.
             operation_status: Optional operational status (e.g., OPERATIONAL).
-            parameter_point: Optional tuple for parameter coordinates.
+            simulation_key: Optional key identifying the simulation configuration and parameter point of the charges.
             bin_value: Optional list of binary values to annotate the plot.
             kink_induced_operational_status: Optional information to specify if kinks induce the layout to become non-operational.
 
         Returns:
-            Path to the saved plot image.
+            The rendered plot.
         """
-        # Generate the plot and return the path to the saved image
-        script_dir = Path(__file__).resolve().parent
-
-        # Define the plot path based on the script directory
-        if charge_lyt is not None:
-            plot_image_path = (
-                script_dir / "caching" / f"lyt_plot_{slider_value}_x_{parameter_point[0]}_y_{parameter_point[1]}.svg"
-            )
-        elif input_encoding is not None:
-            plot_image_path = script_dir / "caching" / f"lyt_plot_{input_encoding}_{slider_value}.svg"
-        else:
-            plot_image_path = script_dir / "caching" / f"lyt_plot_{slider_value}.svg"
-
-        # Create the caching directory only if it does not exist
-        if not plot_image_path.parent.exists():
-            plot_image_path.parent.mkdir(parents=True, exist_ok=True)
+        plot_name = self.plot_name(slider_value, input_encoding, simulation_key if charge_lyt is not None else None)
 
         # Proceed with generating the plot
         all_cells = lyt.cells()
@@ -84,101 +301,85 @@ class LayoutVisualizer(QWidget):
         negative_color = "#00ADAE"
         positive_color = "#E34857"
 
-        step_size = 1
         alpha = 0.5
 
-        fig, ax = plt.subplots(figsize=(12, 12), dpi=500)
-        fig.patch.set_facecolor("#2d333b")
-        ax.set_facecolor("#2d333b")
-        ax.axis("off")
-
-        bb_min_shifted = pyfiction.offset_coordinate(bb_min.x, bb_min.y)
-        bb_min_shifted.x += padding_x
-        bb_min_shifted.y += padding_y
-
-        bb_max_shifted = pyfiction.offset_coordinate(bb_max.x, bb_max.y)
-        bb_max_shifted.x += padding_x
-        bb_max_shifted.y += padding_y
-
-        bb_min_shifted_nm = pyfiction.sidb_nm_position(lyt, bb_min_shifted)
-        bb_max_shifted_nm = pyfiction.sidb_nm_position(lyt, bb_max_shifted)
-
-        # Iterate through grid and plot positions
-        for x in np.arange(bb_min.x, bb_max.x + padding_x * 2 + 1, step_size):
-            for y in np.arange(bb_min.y, bb_max.y + padding_y * 3, step_size):
-                nm_pos = pyfiction.sidb_nm_position(lyt, pyfiction.offset_coordinate(x, y))
-                ax.plot(
-                    nm_pos[0],
-                    -nm_pos[1],
-                    "o",
-                    color=neutral_dot_color,
-                    markersize=markersize_grid,
-                    markeredgewidth=0,
-                    alpha=alpha,
-                )
-
+        # Look up the nm positions of the (padded) bounding box corners from the cached grid
+        bb_min_shifted_nm, bb_max_shifted_nm = self._get_cell_nm_positions(
+            lyt,
+            np.array([(bb_min.x + padding_x, bb_min.y + padding_y), (bb_max.x + padding_x, bb_max.y + padding_y)]),
+            bb_min,
+            bb_max,
+            padding_x,
+            padding_y,
+        )
+
+        ax = self.ax
+        grid_key = (bb_min.x, bb_min.y, bb_max.x, bb_max.y)
+
+        if grid_key == self._grid_artist_key:
+            # The background grid is static for the bounding box; only remove the artists of the previous plot
+            for artist in [*ax.collections, *ax.texts, *ax.patches]:
+                if artist is not self._grid_artist:
+                    artist.remove()
+        else:
+            # Reset the reused axes and plot all (cached) grid point positions at once
+            ax.clear()
+            ax.set_facecolor("#2d333b")
+            ax.axis("off")
+
+            grid_nm_positions = self._get_grid_nm_positions(lyt, bb_min, bb_max, padding_x, padding_y)
+            self._grid_artist = ax.scatter(
+                grid_nm_positions[:, 0],
+                -grid_nm_positions[:, 1],
+                s=markersize_grid**2,
+                color=neutral_dot_color,
+                linewidths=0,
+                alpha=alpha,
+            )
+            self._grid_artist_key = grid_key
+
+        # Face and edge colors of the cells per charge state (None if no charges are plotted)
+        cell_styles = {
+            pyfiction.sidb_charge_state.NEGATIVE: (negative_color, negative_color),
+            pyfiction.sidb_charge_state.POSITIVE: (positive_color, positive_color),
+            pyfiction.sidb_charge_state.NEUTRAL: ("none", highlight_border_color),
+            None: (highlight_fill_color, highlight_border_color),
+        }
+
+        # Collect the (padded) grid coordinates and colors of all cells with a known charge state
+        cell_coords = []
+        cell_face_colors = []
+        cell_edge_colors = []
         for cell in all_cells:
-            cell_original = pyfiction.offset_coordinate(cell)
-            cell.x += padding_x
-            cell.y += padding_y
-            nm_pos = pyfiction.sidb_nm_position(lyt, cell)
-
-            if charge_lyt is not None:
-                charge_state = charge_lyt.get_charge_state(cell_original)
-                if charge_state == pyfiction.sidb_charge_state.NEGATIVE:
-                    ax.plot(
-                        nm_pos[0],
-                        -nm_pos[1],
-                        "o",
-                        color=negative_color,
-                        markersize=markersize,
-                        markeredgewidth=edge_width,
-                    )
-                elif charge_state == pyfiction.sidb_charge_state.POSITIVE:
-                    ax.plot(
-                        nm_pos[0],
-                        -nm_pos[1],
-                        "o",
-                        color=positive_color,
-                        markersize=markersize,
-                        markeredgewidth=edge_width,
-                    )
-                elif charge_state == pyfiction.sidb_charge_state.NEUTRAL:
-                    ax.plot(
-                        nm_pos[0],
-                        -nm_pos[1],
-                        "o",
-                        color=highlight_border_color,
-                        markerfacecolor="None",
-                        markersize=markersize,
-                        markeredgewidth=edge_width,
-                    )
-            else:
-                ax.plot(
-                    nm_pos[0],
-                    -nm_pos[1],
-                    "o",
-                    markerfacecolor=highlight_fill_color,
-                    markeredgecolor=highlight_border_color,
-                    markersize=markersize,
-                    markeredgewidth=edge_width,
-                )
+            charge_state = charge_lyt.get_charge_state(cell) if charge_lyt is not None else None
+            if charge_state not in cell_styles:
+                continue
+            cell_coords.append((cell.x + padding_x, cell.y + padding_y))
+            face_color, edge_color = cell_styles[charge_state]
+            cell_face_colors.append(face_color)
+            cell_edge_colors.append(edge_color)
+
+        # Convert all cell coordinates to nm positions and plot all cells at once
+        if cell_coords:
+            cell_nm_positions = self._get_cell_nm_positions(
+                lyt, np.array(cell_coords, dtype=int), bb_min, bb_max, padding_x, padding_y
+            )
+            ax.scatter(
+                cell_nm_positions[:, 0],
+                -cell_nm_positions[:, 1],
+                s=markersize**2,
+                facecolors=cell_face_colors,
+                edgecolors=cell_edge_colors,
+                linewidths=edge_width,
+            )
 
         if bin_value is not None:
             # Define input cells and add the binary value annotations
-            input_cells = pyfiction.detect_bdl_pairs(lyt_original, pyfiction.sidb_technology.cell_type.INPUT)
-
-            for idx, cell in enumerate(input_cells):
-                cell.upper.x += padding_x
-                cell.upper.y += padding_y
-
-                cell.lower.x += padding_x
-                cell.lower.y += padding_y
-
-                # Get the input cell's SiDB nm position
-                nm_pos_lower = pyfiction.sidb_nm_position(lyt, cell.lower)
-                nm_pos_upper = pyfiction.sidb_nm_position(lyt, cell.upper)
+            input_nm_positions = self._get_bdl_pair_nm_positions(
+                lyt, lyt_original, pyfiction.sidb_technology.cell_type.INPUT, bb_min, bb_max, padding_x, padding_y
+            )
 
+            for idx, (nm_pos_upper, nm_pos_lower) in enumerate(input_nm_positions):
                 nm_pos_x = (nm_pos_lower[0] + nm_pos_upper[0]) / 2
 
                 # Plot the binary value corresponding to the input cell
@@ -196,14 +397,46 @@ class LayoutVisualizer(QWidget):
                 )
 
         if operation_status is not None:
-            output_cells = pyfiction.detect_bdl_pairs(lyt, pyfiction.sidb_technology.cell_type.OUTPUT)
-            for cell in output_cells:
-                cell.lower.x += padding_x
-                cell.lower.y += padding_y
-                cell.upper.x += padding_x
-                cell.upper.y += padding_y
-                nm_pos_upper = pyfiction.sidb_nm_position(lyt, cell.upper)
-                nm_pos_lower = pyfiction.sidb_nm_position(lyt, cell.lower)
+            # The output BDL pairs are not affected by the input pattern and can be taken from the original layout
+            output_nm_positions = self._get_bdl_pair_nm_positions(
+                lyt, lyt_original, pyfiction.sidb_technology.cell_type.OUTPUT, bb_min, bb_max, padding_x, padding_y
+            )
+            # The boxes around the output cells are collected and drawn as a single collection
+            output_boxes = []
+            output_box_colors = []
+
+            def draw_rectangle(x: float, y: float, width: float, height: float, color: str) -> None:
+                output_boxes.append(Rectangle((x, -y), width, -height))
+                output_box_colors.append(color)
+
+            def add_status_text(ax: Axes, x: float, y: float, text: str, color: str, fontsize: int) -> None:
+                ax.text(
+                    x,
+                    y,
+                    text,
+                    color=color,
+                    fontsize=fontsize,
+                    fontweight="bold",
+                    horizontalalignment="center",
+                    verticalalignment="center",
+                )
+
+            # The kink symbol is placed relative to the bounding box and thus only drawn once for all output cells
+            if (
+                len(output_nm_positions) > 0
+                and kink_induced_operational_status == pyfiction.operational_status.NON_OPERATIONAL
+                and operation_status == pyfiction.operational_status.OPERATIONAL
+            ):
+                add_status_text(
+                    ax,
+                    (bb_min_shifted_nm[0] + bb_max_shifted_nm[0]) * 0.5,
+                    -(bb_min_shifted_nm[1] + bb_max_shifted_nm[1]) * 0.1,
+                    "⚡",
+                    "red",
+                    40,
+                )
+
+            for nm_pos_upper, nm_pos_lower in output_nm_positions:
                 box_x = nm_pos_upper[0]
                 box_y = nm_pos_upper[1]
                 width = abs(nm_pos_upper[0] - nm_pos_lower[0]) + 1
@@ -212,42 +445,19 @@ class LayoutVisualizer(QWidget):
                 box_x -= 0.5
                 box_y -= 0.5
 
-                def draw_rectangle(ax: Axes, x: float, y: float, width: float, height: float, color: str) -> None:
-                    rect = Rectangle((x, -y), width, -height, linewidth=1.5, edgecolor=color, facecolor="none")
-                    ax.add_patch(rect)
-
-                def add_status_text(ax: Axes, x: float, y: float, text: str, color: str, fontsize: int) -> None:
-                    ax.text(
-                        x,
-                        y,
-                        text,
-                        color=color,
-                        fontsize=fontsize,
-                        fontweight="bold",
-                        horizontalalignment="center",
-                        verticalalignment="center",
-                    )
-
                 if kink_induced_operational_status is not None:
                     if kink_induced_operational_status == pyfiction.operational_status.OPERATIONAL:
-                        draw_rectangle(ax, box_x, box_y, width, height, "green")
-
-                    elif kink_induced_operational_status == pyfiction.operational_status.NON_OPERATIONAL:
-                        if operation_status == pyfiction.operational_status.OPERATIONAL:
-                            add_status_text(
-                                ax,
-                                (bb_min_shifted_nm[0] + bb_max_shifted_nm[0]) * 0.5,
-                                -(bb_min_shifted_nm[1] + bb_max_shifted_nm[1]) * 0.1,
-                                "⚡",
-                                "red",
-                                40,
-                            )
-                        elif operation_status == pyfiction.operational_status.NON_OPERATIONAL:
-                            draw_rectangle(ax, box_x, box_y, width, height, "red")
+                        draw_rectangle(box_x, box_y, width, height, "green")
+
+                    elif (
+                        kink_induced_operational_status == pyfiction.operational_status.NON_OPERATIONAL
+                        and operation_status == pyfiction.operational_status.NON_OPERATIONAL
+                    ):
+                        draw_rectangle(box_x, box_y, width, height, "red")
 
                 else:  # When operational_status_kinks is None
                     if operation_status == pyfiction.operational_status.OPERATIONAL:
-                        draw_rectangle(ax, box_x, box_y, width, height, "green")
+                        draw_rectangle(box_x, box_y, width, height, "green")
                         add_status_text(
                             ax,
                             box_x + 1.5 * width,
@@ -257,7 +467,7 @@ class LayoutVisualizer(QWidget):
                             45,
                         )
                     else:
-                        draw_rectangle(ax, box_x, box_y, width, height, "red")
+                        draw_rectangle(box_x, box_y, width, height, "red")
                         add_status_text(
                             ax,
                             box_x + 1.5 * width,
@@ -267,7 +477,65 @@ class LayoutVisualizer(QWidget):
                             30,
                         )
 
-        plt.savefig(plot_image_path, bbox_inches="tight", dpi=500)
-        plt.close()
+            if output_boxes:
+                ax.add_collection(
+                    PatchCollection(output_boxes, facecolors="none", edgecolors=output_box_colors, linewidths=1.5)
+                )
+
+        # Rasterize the plot since it is only ever displayed as a QPixmap; it is kept in memory instead of on disk
+        buffer = BytesIO()
+        self.fig.savefig(buffer, format="png", bbox_inches="tight", dpi="figure")
+        self.plots[plot_name] = buffer.getvalue()
+
+        return self.get_plot(plot_name)
+
+    @staticmethod
+    def plot_name(
+        slider_value: int,
+        input_encoding: Literal["distance", "presence"] | None = None,
+        simulation_key: Hashable | None = None,
+    ) -> str:
+        """Returns the name under which a rendered layout plot is stored.
+
+        Args:
+            slider_value: Value of the slider, i.e., the index of the input pattern.
+            input_encoding: Optional input signal encoding type of the plot without charges.
+            simulation_key: Optional key identifying the simulation configuration and parameter point of the plot with
+                charges; takes precedence over input_encoding.
+
+        Returns:
+            Name of the plot.
+        """
+        if simulation_key is not None:
+            return f"lyt_plot_{slider_value}_sim_{simulation_key!r}"
+        if input_encoding is not None:
+            return f"lyt_plot_{input_encoding}_{slider_value}"
+        return f"lyt_plot_{slider_value}"
+
+    def clear_plots(self) -> None:
+        """Discards all rendered layout plots, e.g., because they show a layout that is no longer loaded."""
+        self.plots.clear()
 
-        return plot_image_path
+    def discard_plots(self, simulation_key: Hashable) -> None:
+        """Discards the rendered layout plots with charges of all input patterns of the given simulation.
+
+        Args:
+            simulation_key: Key identifying the simulation configuration and parameter point of the plots.
+        """
+        suffix = f"_sim_{simulation_key!r}"
+        for plot_name in [plot_name for plot_name in self.plots if plot_name.endswith(suffix)]:
+            del self.plots[plot_name]
+
+    def get_plot(self, plot_name: str) -> QPixmap:
+        """Returns a previously rendered layout plot.
+
+        Args:
+            plot_name: Name of the plot as returned by plot_name.
+
+        Returns:
+            The rendered plot or a null pixmap if no plot of that name has been rendered.
+        """
+        pixmap = QPixmap()
+        if plot_name in self.plots:
+            pixmap.loadFromData(self.plots[plot_name], "PNG")
+        return pixmap
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from pathlib import Path
+from functools import cache, partial
+from io import StringIO
 from typing import TYPE_CHECKING
 
 import matplotlib.backend_bases
 from core import generate_plot
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QCursor, QPixmap
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QCursor, QIcon, QPixmap
 from PyQt6.QtWidgets import QApplication, QLabel, QMessageBox, QProgressBar, QPushButton, QVBoxLayout, QWidget
 
 from mnt import pyfiction
@@ -16,55 +17,146 @@ from .icon_loader import IconLoader
 from .layout_visualizer_widget import LayoutVisualizer
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
     import matplotlib.backend_bases
 
     from .settings_widget import SettingsWidget
 
+# Map the Boolean function string to the corresponding pyfiction truth table factory; only the truth table of the
+# selected function is created when it is needed
+_BOOLEAN_FUNCTION_MAP: Mapping[str, Callable[[], pyfiction.dynamic_truth_table]] = {
+    "AND": pyfiction.create_and_tt,
+    "OR": pyfiction.create_or_tt,
+    "NAND": pyfiction.create_nand_tt,
+    "NOR": pyfiction.create_nor_tt,
+    "XOR": pyfiction.create_xor_tt,
+    "XNOR": pyfiction.create_xnor_tt,
+}
+
+# Map the simulation engine string to the corresponding pyfiction simulation engine
+_ENGINE_MAP: Mapping[str, pyfiction.sidb_simulation_engine] = {
+    "ExGS": pyfiction.sidb_simulation_engine.EXGS,
+    "QuickExact": pyfiction.sidb_simulation_engine.QUICKEXACT,
+    "QuickSim": pyfiction.sidb_simulation_engine.QUICKSIM,
+}
+
+# Map the operational condition string to the corresponding pyfiction operational condition
+_OP_CONDITION_MAP: Mapping[str, pyfiction.operational_condition] = {
+    "Tolerate Kinks": pyfiction.operational_condition.TOLERATE_KINKS,
+    "Reject Kinks": pyfiction.operational_condition.REJECT_KINKS,
+}
+
+# Map the sweep dimension string to the corresponding pyfiction sweep dimension
+_SWEEP_DIMENSION_MAP: Mapping[str, pyfiction.sweep_parameter] = {
+    "epsilon_r": pyfiction.sweep_parameter.EPSILON_R,
+    "lambda_TF": pyfiction.sweep_parameter.LAMBDA_TF,
+    "μ_": pyfiction.sweep_parameter.MU_MINUS,
+}
+
+# Map the sweep dimension string to the corresponding operational domain file column identifier, which is also the name
+# of the corresponding simulation parameter attribute
+_COLUMN_MAP: Mapping[str, str] = {"epsilon_r": "epsilon_r", "lambda_TF": "lambda_tf", "μ_": "mu_minus"}
+
+
+# Time in milliseconds after the last click on the operational domain plot until the simulation starts
+_CLICK_DEBOUNCE_MS = 150
+
+# Number of most recently clicked parameter points whose input patterns, simulation results, and plots are kept
+_MAX_CACHED_PARAMETER_POINTS = 16
+
+
+@cache
+def _load_refresh_icon() -> QIcon:
+    """Loads the refresh icon of the 'Run Another Simulation' button once and shares it among all widget instances.
+
+    Returns:
+        QIcon: The refresh icon.
+    """
+    return IconLoader().load_refresh_icon()
+
+
+def _copy_layout(lyt: pyfiction.sidb_100_lattice) -> pyfiction.sidb_100_lattice:
+    """Copies the given layout cell by cell. Layouts obtained from a BDL input iterator are views of the iterator's
+    layout, and pyfiction provides no way to clone them.
+
+    Args:
+        lyt: Layout to copy.
+
+    Returns:
+        An independent layout with the same dimensions, name, cells and cell types.
+    """
+    lyt_copy = pyfiction.sidb_100_lattice(pyfiction.offset_coordinate(lyt.x(), lyt.y(), lyt.z()), lyt.get_layout_name())
+    for cell in lyt.cells():
+        lyt_copy.assign_cell_type(cell, lyt.get_cell_type(cell))
+
+    return lyt_copy
+
 
 class SimulationThread(QThread):
     # Signals to communicate with the main thread
     progress = pyqtSignal(int)  # Progress percentage
     finished = pyqtSignal()  # Signal when the thread is finished
-    simulation_result_ready = pyqtSignal(int, object)  # Iteration index and simulation result
+    simulation_result_ready = pyqtSignal(int, object, object)  # Iteration index, input layout and simulation result
 
     def __init__(
         self,
         lyt: pyfiction.charge_distribution_surface_100,
         input_iterator: pyfiction.bdl_input_iterator_100,
         qe_params: pyfiction.quickexact_params,
+        iterations: Iterable[int],
     ) -> None:
         super().__init__()
         self.lyt = lyt
         self.input_iterator = input_iterator
         self.qe_params = qe_params
-        self.num_input_pairs = self.input_iterator.num_input_pairs()
+        self.iterations = frozenset(iterations)
 
     def run(self) -> None:
-        total_steps = 2**self.num_input_pairs  # Calculate total steps
+        total_steps = len(self.iterations)  # Calculate total steps
+        last_progress_value = None  # Last emitted progress percentage
 
-        for i in range(total_steps):
-            # print(f"Running simulation for iteration {i}")  # Debugging statement
+        num_finished = 0
+        for i in range(max(self.iterations, default=-1) + 1):
+            if i in self.iterations:
+                # The iterator's layout changes when the iterator is advanced; the emitted layout therefore has to be a
+                # copy of the current input pattern
+                layout = _copy_layout(self.input_iterator.get_layout())
 
-            # Proceed with the simulation for the current input pattern
-            sim_result = pyfiction.quickexact(self.input_iterator.get_layout(), self.qe_params)
+                # Proceed with the simulation for the current input pattern
+                sim_result = pyfiction.quickexact(layout, self.qe_params)
 
-            # Emit the simulation result for this iteration
-            self.simulation_result_ready.emit(i, sim_result)
+                # Emit the simulation result for this iteration along with the simulated layout
+                self.simulation_result_ready.emit(i, layout, sim_result)
 
-            # Emit the progress update after each iteration
-            progress_value = int(((i + 1) / total_steps) * 100)
-            # print(f"Emitting progress: {progress_value}%")  # Debugging statement
-            self.progress.emit(progress_value)  # Update progress (0-100)
+                # Emit the progress update only if the percentage changed
+                num_finished += 1
+                progress_value = int((num_finished / total_steps) * 100)
+                if progress_value != last_progress_value:
+                    self.progress.emit(progress_value)  # Update progress (0-100)
+                    last_progress_value = progress_value
 
             # Move to the next input pattern
             self.input_iterator += 1
 
-            # Optional delay for testing purposes
-            # time.sleep(0.1)  # Uncomment this line to slow down the simulation for testing
-
         self.finished.emit()  # Signal that the thread has finished
 
 
+class OperationalDomainThread(QThread):
+    # Signal to hand the computed operational domain to the main thread
+    operational_domain_ready = pyqtSignal(object)
+
+    def __init__(self, compute_operational_domain: Callable[[], pyfiction.operational_domain | None]) -> None:
+        # The thread is owned by the application instead of the widget so that discarding the widget during the
+        # computation does not destroy the running thread; it is deleted once it has finished
+        super().__init__(QApplication.instance())
+        self.compute_operational_domain = compute_operational_domain
+        self.finished.connect(self.deleteLater)
+
+    def run(self) -> None:
+        self.operational_domain_ready.emit(self.compute_operational_domain())
+
+
 class PlotOperationalDomainWidget(QWidget):
     def __init__(
         self,
@@ -75,11 +167,15 @@ class PlotOperationalDomainWidget(QWidget):
         qlabel: QLabel,
         slider_value: int | None = None,
         plot_view_active: bool = True,
+        visualizer: LayoutVisualizer | None = None,
     ) -> None:
         super().__init__()
         self.settings_widget = settings_widget
         self.lyt = lyt
         self.previous_dot = None
+        self.previous_text = None
+        # Rendered plot without the highlighted point, used to blit the highlight on top of it
+        self.background = None
         self.slider_value = slider_value
         self.plot_view_active = plot_view_active
 
@@ -90,7 +186,8 @@ class PlotOperationalDomainWidget(QWidget):
         self.max_pos = max_pos_initial
         self.min_pos = min_pos_initial
         self.plot_label = qlabel
-        self.visualizer = LayoutVisualizer()
+        # Reuse the given visualizer (and thereby its figure and caches) if provided
+        self.visualizer = visualizer if visualizer is not None else LayoutVisualizer()
 
         # Initialize the progress bar
         self.progress_bar = QProgressBar(self)
@@ -101,61 +198,83 @@ class PlotOperationalDomainWidget(QWidget):
 
         # Initialize the simulation running flag
         self.simulation_running = False  # Flag to track simulation status
+        # Only the last of several clicks in quick succession starts a simulation
+        self.click_timer = QTimer(self)
+        self.click_timer.setSingleShot(True)
+        self.click_timer.timeout.connect(self.start_debounced_simulation)
         # input combinations for which kinks induce
         # the SiDB layout to become non-operational.
         # This means that the layout is operational if kinks would be accepted.
         self.kink_induced_non_op_patterns = None
+        # Operational and kink-induced non-operational input patterns, keyed by configuration and parameter point; both
+        # caches hold the same keys and are bounded to the most recently clicked parameter points
+        self.input_patterns_cache = {}
+        # Ground state simulation results (quickexact is deterministic), keyed by configuration and parameter point and
+        # then by input pattern index
+        self.simulation_results_cache = {}
+        self.simulation_results = {}
+        # Configuration and grid point of the last simulated parameter point; identifies its cached results and plots
+        self.simulation_key = None
+        # Simulation results of input patterns that have not been plotted yet, keyed by input pattern index
+        self.pending_frames = {}
+        # Input patterns that have been (or are being) simulated at the clicked parameter point
+        self.requested_patterns = set()
+        # Running simulation threads; references are kept until they finish
+        self.simulation_threads = []
+        self.qe_params = None
+
+        self.boolean_function_map = _BOOLEAN_FUNCTION_MAP
+        self.engine_map = _ENGINE_MAP
+        self.op_condition_map = _OP_CONDITION_MAP
+        self.sweep_dimension_map = _SWEEP_DIMENSION_MAP
+        self.column_map = _COLUMN_MAP
 
-        # Map the Boolean function string to the corresponding pyfiction function
-        self.boolean_function_map = {
-            "AND": [pyfiction.create_and_tt()],
-            "OR": [pyfiction.create_or_tt()],
-            "NAND": [pyfiction.create_nand_tt()],
-            "NOR": [pyfiction.create_nor_tt()],
-            "XOR": [pyfiction.create_xor_tt()],
-            "XNOR": [pyfiction.create_xnor_tt()],
-        }
+        self._init_ui()
 
-        self.engine_map = {
-            "ExGS": pyfiction.sidb_simulation_engine.EXGS,
-            "QuickExact": pyfiction.sidb_simulation_engine.QUICKEXACT,
-            "QuickSim": pyfiction.sidb_simulation_engine.QUICKSIM,
-        }
+    def update_slider_value(self, value: int) -> None:
+        self.slider_value = value
 
-        self.op_condition_map = {
-            "Tolerate Kinks": pyfiction.operational_condition.TOLERATE_KINKS,
-            "Reject Kinks": pyfiction.operational_condition.REJECT_KINKS,
-        }
+    def _init_ui(self) -> None:
+        # Add a 'Rerun' button
+        self.rerun_button = QPushButton("Run Another Simulation")
+        self.layout.addWidget(self.rerun_button)
+        # Set the (cached) refresh/reload icon on the 'Rerun' button
+        self.rerun_button.setIcon(_load_refresh_icon())
+        # Going back to the settings (and thus starting another computation) is only possible once the plot is shown
+        self.rerun_button.setEnabled(False)
 
-        # Map the sweep dimension string to the corresponding pyfiction sweep dimension
-        self.sweep_dimension_map = {
-            "epsilon_r": pyfiction.sweep_parameter.EPSILON_R,
-            "lambda_TF": pyfiction.sweep_parameter.LAMBDA_TF,
-            "μ_": pyfiction.sweep_parameter.MU_MINUS,
-        }
+        self.rerun_button.clicked.connect(self.settings_widget.enable_run_button)
 
-        # Map the sweep dimension string to the corresponding operational domain file column identifier
-        self.column_map = {"epsilon_r": "epsilon_r", "lambda_TF": "lambda_tf", "μ_": "mu_minus"}
+        self.rerun_button.clicked.connect(self.on_rerun_clicked)
 
-        self._init_ui()
+        self.setLayout(self.layout)
 
-    def update_slider_value(self, value: int) -> None:
-        self.slider_value = value
+        # Compute the operational domain off the GUI thread and show the plot once it is ready
+        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
+        self.operational_domain_thread = OperationalDomainThread(self.operational_domain_computation())
+        self.operational_domain_thread.operational_domain_ready.connect(
+            self.show_operational_domain, Qt.ConnectionType.QueuedConnection
+        )
+        # Restore the cursor even if the widget has been discarded in the meantime
+        self.operational_domain_thread.finished.connect(QApplication.restoreOverrideCursor)
+        self.operational_domain_thread.start()
 
-    def _init_ui(self) -> None:
-        op_dom = self.operational_domain_computation()
+    def show_operational_domain(self, op_dom: pyfiction.operational_domain) -> None:
+        # This method is called in the main thread
+        self.operational_domain_thread = None
 
         write_op_dom_params = pyfiction.write_operational_domain_params()
         write_op_dom_params.operational_tag = "1"
         write_op_dom_params.non_operational_tag = "0"
 
-        pyfiction.write_operational_domain(op_dom, "op_dom.csv", write_op_dom_params)
+        # Hand the operational domain to the plot in memory instead of round-tripping through a CSV file on disk
+        op_dom_csv = StringIO(pyfiction.write_operational_domain_to_string(op_dom, write_op_dom_params))
 
         self.three_dimensional_plot = self.settings_widget.get_z_dimension() != "NONE"
 
         # Generate the plot
         self.fig, self.ax = generate_plot(
-            ["op_dom.csv"],
+            [op_dom_csv],
             x_param=self.column_map[self.settings_widget.get_x_dimension()],
             y_param=self.column_map[self.settings_widget.get_y_dimension()],
             z_param=self.column_map[self.settings_widget.get_z_dimension()] if self.three_dimensional_plot else None,
@@ -169,33 +288,39 @@ class PlotOperationalDomainWidget(QWidget):
             show_legend=True,
         )
 
-        # Delete the CSV file after it's used
-        csv_file_path = Path("op_dom.csv")
-        if Path.exists(csv_file_path):
-            Path.unlink(csv_file_path)
-
         self.canvas = FigureCanvas(self.fig)
-        self.layout.addWidget(self.canvas)
+        # Place the plot between the progress bar and the 'Rerun' button
+        self.layout.insertWidget(self.layout.indexOf(self.rerun_button), self.canvas)
 
         if not self.three_dimensional_plot:
             # Connect the 'button_press_event' to the 'on_click' function
             self.fig.canvas.mpl_connect("button_press_event", self.on_click)
+            # Cache the rendered plot whenever it is fully redrawn (e.g., on resize) to blit the highlight on top of it
+            self.fig.canvas.mpl_connect("draw_event", self.on_draw)
+
+        self.rerun_button.setEnabled(True)
+
+    def on_draw(self, _event: matplotlib.backend_bases.DrawEvent) -> None:
+        # The highlight artists are animated and thus not part of the full redraw
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_highlight()
+
+    def draw_highlight(self) -> None:
+        # Draw the highlighted point and its label (if any) on top of the plot
+        if self.previous_dot is not None:
+            self.ax.draw_artist(self.previous_dot)
+            self.ax.draw_artist(self.previous_text)
+
+    def blit_highlight(self) -> None:
+        # Fall back to a full redraw if the plot has not been rendered yet; on_draw caches it for subsequent blits
+        if self.background is None:
+            self.fig.canvas.draw_idle()
+            return
 
-        icon_loader = IconLoader()
-
-        # Add a 'Rerun' button
-        self.rerun_button = QPushButton("Run Another Simulation")
-        self.layout.addWidget(self.rerun_button)
-        # Get the refresh/reload icon
-        refresh_icon = icon_loader.load_refresh_icon()
-        # Set the icon on the 'Rerun' button
-        self.rerun_button.setIcon(refresh_icon)
-
-        self.rerun_button.clicked.connect(self.settings_widget.enable_run_button)
-
-        self.rerun_button.clicked.connect(self.on_rerun_clicked)
-
-        self.setLayout(self.layout)
+        # Only repaint the highlight on top of the cached plot instead of re-rendering the whole figure
+        self.fig.canvas.restore_region(self.background)
+        self.draw_highlight()
+        self.fig.canvas.blit(self.fig.bbox)
 
     # Custom method to handle the 'Rerun' button click
     def on_rerun_clicked(self) -> None:
@@ -205,7 +330,13 @@ class PlotOperationalDomainWidget(QWidget):
     def set_pixmap(self, pixmap: QPixmap) -> None:
         self.pixmap = pixmap
 
-    def operational_domain_computation(self) -> pyfiction.operational_domain | None:
+    def operational_domain_computation(self) -> Callable[[], pyfiction.operational_domain | None]:
+        """Collects the operational domain parameters from the settings. The settings are read in the main thread,
+        whereas the returned computation does not access any widgets and can thus be run in a separate thread.
+
+        Returns:
+            The operational domain computation of the selected algorithm.
+        """
         self.sim_params = pyfiction.sidb_simulation_parameters()
         self.sim_params.base = 2
         self.sim_params.epsilon_r = self.settings_widget.get_epsilon_r()
@@ -254,25 +385,37 @@ class PlotOperationalDomainWidget(QWidget):
 
         op_dom_params.sweep_dimensions = sweep_dimensions
 
-        gate_func = self.boolean_function_map[self.settings_widget.get_boolean_function()]
+        gate_func = [self.boolean_function_map[self.settings_widget.get_boolean_function()]()]
 
         algo = self.settings_widget.get_algorithm()
 
         if algo == "Grid Search":
-            return pyfiction.operational_domain_grid_search(self.lyt, gate_func, op_dom_params)
+            return partial(pyfiction.operational_domain_grid_search, self.lyt, gate_func, op_dom_params)
         if algo == "Random Sampling":
-            return pyfiction.operational_domain_random_sampling(
-                self.lyt, gate_func, self.settings_widget.get_random_samples(), op_dom_params
+            return partial(
+                pyfiction.operational_domain_random_sampling,
+                self.lyt,
+                gate_func,
+                self.settings_widget.get_random_samples(),
+                op_dom_params,
             )
         if algo == "Flood Fill":
-            return pyfiction.operational_domain_flood_fill(
-                self.lyt, gate_func, self.settings_widget.get_random_samples(), op_dom_params
+            return partial(
+                pyfiction.operational_domain_flood_fill,
+                self.lyt,
+                gate_func,
+                self.settings_widget.get_random_samples(),
+                op_dom_params,
             )
         if algo == "Contour Tracing":
-            return pyfiction.operational_domain_contour_tracing(
-                self.lyt, gate_func, self.settings_widget.get_random_samples(), op_dom_params
+            return partial(
+                pyfiction.operational_domain_contour_tracing,
+                self.lyt,
+                gate_func,
+                self.settings_widget.get_random_samples(),
+                op_dom_params,
             )
-        return None
+        return lambda: None
 
     def on_click(self, event: matplotlib.backend_bases.MouseEvent) -> None:
         self.plot_view_active = False
@@ -286,19 +429,32 @@ class PlotOperationalDomainWidget(QWidget):
                 )
                 return  # Ignore the click
 
-            # Proceed with handling the click
-            self.simulation_running = True  # Set the flag
-            QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))  # Set the wait cursor
+            # A parameter point can only be simulated if X and Y sweep different simulation parameters
+            x_attribute = self.column_map[self.settings_widget.get_x_dimension()]
+            y_attribute = self.column_map[self.settings_widget.get_y_dimension()]
+            if x_attribute == y_attribute:
+                QMessageBox.warning(
+                    self,
+                    "Invalid Sweep Dimensions",
+                    f"X and Y dimension both sweep the same simulation parameter '{x_attribute}'. "
+                    "Please select different sweep dimensions to simulate a parameter point.",
+                )
+                return  # Ignore the click
+
+            # Proceed with handling the click; input patterns of a previously clicked point are no longer simulated
+            self.qe_params = None
 
-            # Get the step sizes for the x and y dimensions
-            _x_min, _x_max, x_step = self.settings_widget.get_x_parameter_range()
-            _y_min, _y_max, y_step = self.settings_widget.get_y_parameter_range()
+            # Get the minima and step sizes for the x and y dimensions
+            x_min, _x_max, x_step = self.settings_widget.get_x_parameter_range()
+            y_min, _y_max, y_step = self.settings_widget.get_y_parameter_range()
 
-            # Round the clicked coordinates to the nearest plotted point
-            self.x = round(event.xdata / x_step) * x_step
-            self.y = round(event.ydata / y_step) * y_step
+            # Snap the clicked coordinates to the integer index of the nearest grid point of the sweep
+            self.x_index = round((event.xdata - x_min) / x_step)
+            self.y_index = round((event.ydata - y_min) / y_step)
 
-            # Print the rounded coordinates
+            # Derive the parameter point from the grid indices
+            self.x = x_min + self.x_index * x_step
+            self.y = y_min + self.y_index * y_step
 
             # Remove the previous dot and text if they exist
             if self.previous_dot is not None:
@@ -308,7 +464,7 @@ class PlotOperationalDomainWidget(QWidget):
                 self.previous_text = None
 
             # Highlight the clicked point
-            self.previous_dot = event.inaxes.scatter(self.x, self.y, s=50, color="yellow", zorder=5)
+            self.previous_dot = event.inaxes.scatter(self.x, self.y, s=50, color="yellow", zorder=5, animated=True)
 
             # Add the coordinates as text next to the yellow dot with a white box
             self.previous_text = event.inaxes.text(
@@ -318,39 +474,38 @@ class PlotOperationalDomainWidget(QWidget):
                 fontsize=10,
                 color="black",
                 bbox={"facecolor": "white", "alpha": 0.8, "edgecolor": "none", "boxstyle": "round,pad=0.3"},
+                animated=True,
             )
 
-            # Redraw the plot
-            self.fig.canvas.draw()
+            # Repaint the highlight on top of the cached plot
+            self.blit_highlight()
+
+            # Start the simulation once no further click follows within the debounce interval
+            self.click_timer.start(_CLICK_DEBOUNCE_MS)
 
-            # Process any pending events to ensure GUI updates are shown
-            QApplication.processEvents()
+    def start_debounced_simulation(self) -> None:
+        self.simulation_running = True  # Set the flag
+        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))  # Set the wait cursor
 
-            # Start the simulation in a separate thread
-            self.start_simulation_thread()
+        # Start the simulation in a separate thread
+        self.start_simulation_thread()
 
     def start_simulation_thread(self) -> None:
-        # Set up simulation parameters
-        self.qe_sim_params = self.sim_params
+        # Set up simulation parameters as a copy of the base parameters so that the clicked parameter point does not
+        # leak into the base parameters used by subsequent clicks
+        self.qe_sim_params = pyfiction.sidb_simulation_parameters()
+        self.qe_sim_params.base = self.sim_params.base
+        self.qe_sim_params.epsilon_r = self.sim_params.epsilon_r
+        self.qe_sim_params.lambda_tf = self.sim_params.lambda_tf
+        self.qe_sim_params.mu_minus = self.sim_params.mu_minus
 
         # Get the selected x and y dimensions
         x_dimension = self.settings_widget.get_x_dimension()
         y_dimension = self.settings_widget.get_y_dimension()
 
-        # Set the parameters based on the selected dimensions
-        if x_dimension == "epsilon_r":
-            self.qe_sim_params.epsilon_r = self.x
-        elif x_dimension == "lambda_TF":
-            self.qe_sim_params.lambda_tf = self.x
-        elif x_dimension == "μ_":
-            self.qe_sim_params.mu_minus = self.x
-
-        if y_dimension == "epsilon_r":
-            self.qe_sim_params.epsilon_r = self.y
-        elif y_dimension == "lambda_TF":
-            self.qe_sim_params.lambda_tf = self.y
-        elif y_dimension == "μ_":
-            self.qe_sim_params.mu_minus = self.y
+        # Set the parameters based on the selected dimensions; on_click ensures that they differ
+        setattr(self.qe_sim_params, self.column_map[x_dimension], self.x)
+        setattr(self.qe_sim_params, self.column_map[y_dimension], self.y)
 
         # Perform Positive Charges Check in the Main Thread
         positive_charges_possible = pyfiction.can_positive_charges_occur(self.lyt, self.qe_sim_params)
@@ -377,7 +532,7 @@ class PlotOperationalDomainWidget(QWidget):
                     self.previous_text.remove()
                     self.previous_dot = None
                     self.previous_text = None
-                self.fig.canvas.draw()
+                self.blit_highlight()
                 self.simulation_running = False  # Reset the simulation flag
                 QApplication.restoreOverrideCursor()  # Restore the cursor
                 return  # Exit the method
@@ -395,40 +550,139 @@ class PlotOperationalDomainWidget(QWidget):
             if self.settings_widget.get_input_signal_encoding() == "Distance Encoding"
             else pyfiction.input_bdl_configuration.PERTURBER_ABSENCE_ENCODED
         )
-        input_iterator = pyfiction.bdl_input_iterator_100(self.lyt, bdl_input_iterator_params)
+        self.bdl_input_iterator_params = bdl_input_iterator_params
+
+        # The number of input pairs is invariant for the layout and is thus queried only once per simulation
+        self.num_input_pairs = pyfiction.bdl_input_iterator_100(self.lyt, bdl_input_iterator_params).num_input_pairs()
 
         is_op_params = pyfiction.is_operational_params()
         is_op_params.input_bdl_iterator_params = bdl_input_iterator_params
         is_op_params.op_condition = self.op_condition_map[self.settings_widget.get_operational_condition()]
-        is_op_params.simulation_parameters = self.sim_params
+        is_op_params.simulation_parameters = self.qe_sim_params
         is_op_params.sim_engine = self.engine_map[self.settings_widget.get_simulation_engine()]
 
-        # Get the gate function
-        gate_func = self.boolean_function_map[self.settings_widget.get_boolean_function()]
+        # The operational input patterns only depend on the configuration and the clicked parameter point, which makes
+        # them reusable when the same point is clicked again. The point is identified by its integer grid indices within
+        # the sweep rather than by the derived floating-point parameter values.
+        x_min, _x_max, x_step = self.settings_widget.get_x_parameter_range()
+        y_min, _y_max, y_step = self.settings_widget.get_y_parameter_range()
+        patterns_key = (
+            self.settings_widget.get_boolean_function(),
+            self.settings_widget.get_input_signal_encoding(),
+            self.settings_widget.get_operational_condition(),
+            self.settings_widget.get_simulation_engine(),
+            self.sim_params.base,
+            self.sim_params.epsilon_r,
+            self.sim_params.lambda_tf,
+            self.sim_params.mu_minus,
+            (x_dimension, x_min, x_step),
+            (y_dimension, y_min, y_step),
+            self.x_index,
+            self.y_index,
+        )
+        self.simulation_key = patterns_key
+
+        if patterns_key not in self.input_patterns_cache:
+            # Get the gate function
+            gate_func = [self.boolean_function_map[self.settings_widget.get_boolean_function()]()]
+
+            kink_induced_non_op_patterns = None
+            if (
+                self.op_condition_map[self.settings_widget.get_operational_condition()]
+                == pyfiction.operational_condition.REJECT_KINKS
+            ):
+                kink_induced_non_op_patterns = frozenset(
+                    int(pattern)
+                    for pattern in pyfiction.kink_induced_non_operational_input_patterns(
+                        self.lyt, gate_func, is_op_params
+                    )
+                )
 
-        if (
-            self.op_condition_map[self.settings_widget.get_operational_condition()]
-            == pyfiction.operational_condition.REJECT_KINKS
-        ):
-            self.kink_induced_non_op_patterns = pyfiction.kink_induced_non_operational_input_patterns(
-                self.lyt, gate_func, is_op_params
+            # Store the operational input patterns as a set for constant-time lookups per simulated input pattern
+            operational_patterns = frozenset(
+                int(pattern) for pattern in pyfiction.operational_input_patterns(self.lyt, gate_func, is_op_params)
             )
 
-        self.operational_patterns = pyfiction.operational_input_patterns(self.lyt, gate_func, is_op_params)
+            self.input_patterns_cache[patterns_key] = (operational_patterns, kink_induced_non_op_patterns)
+
+        self.operational_patterns, kink_induced_non_op_patterns = self.input_patterns_cache[patterns_key]
+        if kink_induced_non_op_patterns is not None:
+            self.kink_induced_non_op_patterns = kink_induced_non_op_patterns
+
+        # Discard results of the previously clicked parameter point that have not been plotted
+        self.pending_frames.clear()
+        self.requested_patterns.clear()
+        # Move the parameter point to the end of the cache so that the least recently clicked points are evicted first
+        self.simulation_results = self.simulation_results_cache.pop(patterns_key, {})
+        self.simulation_results_cache[patterns_key] = self.simulation_results
+        self.evict_cached_parameter_points()
+
+        QApplication.restoreOverrideCursor()  # The simulation thread sets its own wait cursor
+
+        # The operational status of all input patterns is known at this point. The (expensive) ground state simulation
+        # is only run for the displayed input pattern; other patterns are simulated once they are displayed.
+        self.simulate_input_patterns([self.get_slider_value()])
+
+        # No simulation thread has been started if the result was already cached
+        if not self.simulation_threads:
+            self.simulation_running = False
+
+    def evict_cached_parameter_points(self) -> None:
+        """Discards the cached input patterns, simulation results, and plots of the least recently clicked parameter
+        points so that at most _MAX_CACHED_PARAMETER_POINTS of them are kept.
+        """
+        while len(self.simulation_results_cache) > _MAX_CACHED_PARAMETER_POINTS:
+            simulation_key = next(iter(self.simulation_results_cache))
+            del self.simulation_results_cache[simulation_key]
+            self.input_patterns_cache.pop(simulation_key, None)
+            self.visualizer.discard_plots(simulation_key)
+
+    def simulate_input_patterns(self, iterations: Iterable[int]) -> None:
+        """Simulates the given input patterns at the clicked parameter point in a separate thread. Input patterns that
+        have already been simulated are skipped, and results that are cached from a previous click on the same parameter
+        point are handled right away.
+
+        Args:
+            iterations: Indices of the input patterns to simulate.
+        """
+        if self.qe_params is None:
+            return
+
+        iterations = [i for i in iterations if i not in self.requested_patterns]
+        self.requested_patterns.update(iterations)
+
+        for iteration in [i for i in iterations if i in self.simulation_results]:
+            self.handle_simulation_result(iteration, *self.simulation_results[iteration])
+
+        iterations = [i for i in iterations if i not in self.simulation_results]
+        if not iterations:
+            return
+
+        self.simulation_running = True  # Set the flag
+        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))  # Set the wait cursor
 
         # Create a new simulation thread with necessary data
-        self.simulation_thread = SimulationThread(self.lyt, input_iterator, self.qe_params)
-        self.simulation_thread.progress.connect(self.update_progress_bar, Qt.ConnectionType.QueuedConnection)
-        self.simulation_thread.finished.connect(self.simulation_finished, Qt.ConnectionType.QueuedConnection)
-        self.simulation_thread.finished.connect(self.simulation_thread.deleteLater, Qt.ConnectionType.QueuedConnection)
-        self.simulation_thread.simulation_result_ready.connect(
+        input_iterator = pyfiction.bdl_input_iterator_100(self.lyt, self.bdl_input_iterator_params)
+        simulation_thread = SimulationThread(self.lyt, input_iterator, self.qe_params, iterations)
+        simulation_thread.progress.connect(self.update_progress_bar, Qt.ConnectionType.QueuedConnection)
+        simulation_thread.finished.connect(
+            partial(self.simulation_finished, simulation_thread), Qt.ConnectionType.QueuedConnection
+        )
+        simulation_thread.simulation_result_ready.connect(
             self.handle_simulation_result, Qt.ConnectionType.QueuedConnection
         )
+        self.simulation_threads.append(simulation_thread)
         # Start the thread
-        self.simulation_thread.start()
+        simulation_thread.start()
 
-    def handle_simulation_result(self, iteration: int, sim_result: pyfiction.sidb_simulation_result_100) -> None:
+    def handle_simulation_result(
+        self,
+        iteration: int,
+        input_lyt: pyfiction.charge_distribution_surface_100,
+        sim_result: pyfiction.sidb_simulation_result_100,
+    ) -> None:
         # This method is called in the main thread
+        self.simulation_results[iteration] = (input_lyt, sim_result)
 
         if not sim_result.charge_distributions:
             QMessageBox.warning(
@@ -450,72 +704,61 @@ class PlotOperationalDomainWidget(QWidget):
         if self.kink_induced_non_op_patterns is not None and iteration in self.kink_induced_non_op_patterns:
             kink_induced_operational_status = pyfiction.operational_status.NON_OPERATIONAL
 
-        # Initialize an input iterator
-        bdl_input_iterator_params = pyfiction.bdl_input_iterator_params()
-        bdl_input_iterator_params.input_bdl_config = (
-            pyfiction.input_bdl_configuration.PERTURBER_DISTANCE_ENCODED
-            if self.settings_widget.get_input_signal_encoding() == "Distance Encoding"
-            else pyfiction.input_bdl_configuration.PERTURBER_ABSENCE_ENCODED
-        )
-        input_iterator = pyfiction.bdl_input_iterator_100(self.lyt, bdl_input_iterator_params)
-
-        # Advance the iterator to match the current iteration
-        for _ in range(iteration):
-            input_iterator += 1
-
         # Create binary representation with proper padding
-        bin_value = f"{iteration:0{input_iterator.num_input_pairs()}b}"
-
-        # Plot the new layout and charge distribution
-        _ = self.visualizer.visualize_layout(
-            self.lyt,
-            input_iterator.get_layout(),
-            self.min_pos,
-            self.max_pos,
-            slider_value=iteration,
-            charge_lyt=gs,
-            operation_status=status,
-            parameter_point=(self.x, self.y),
-            bin_value=bin_value,
-            kink_induced_operational_status=kink_induced_operational_status,
-            input_encoding="distance"
+        bin_value = f"{iteration:0{self.num_input_pairs}b}"
+
+        # Defer plotting until the frame is actually viewed; only the currently selected input pattern is rendered now
+        self.pending_frames[iteration] = {
+            "lyt": input_lyt,
+            "charge_lyt": gs,
+            "operation_status": status,
+            "simulation_key": self.simulation_key,
+            "bin_value": bin_value,
+            "kink_induced_operational_status": kink_induced_operational_status,
+            "input_encoding": "distance"
             if self.settings_widget.get_input_signal_encoding() == "Distance Encoding"
             else "presence",
-        )
+        }
 
         # Update the QLabel if this is the current slider value
         if iteration == self.get_slider_value():
-            plot_image_path = self.visualizer.visualize_layout(
-                self.lyt,
-                input_iterator.get_layout(),
-                self.min_pos,
-                self.max_pos,
-                slider_value=self.get_slider_value(),
-                charge_lyt=gs,
-                operation_status=status,
-                parameter_point=(self.x, self.y),
-                bin_value=bin_value,
-                kink_induced_operational_status=kink_induced_operational_status,
-                input_encoding="distance"
-                if self.settings_widget.get_input_signal_encoding() == "Distance Encoding"
-                else "presence",
-            )
-
-            self.pixmap = QPixmap(str(plot_image_path))
+            self.pixmap = self.render_pending_frame(iteration)
             self.plot_label.setPixmap(self.pixmap)
 
+    def render_pending_frame(self, iteration: int) -> QPixmap | None:
+        """Renders the simulation result of the given input pattern if it has not been rendered yet. If the input
+        pattern has not been simulated yet, its simulation is started and the plot is shown once the result is ready.
+
+        Args:
+            iteration: Index of the input pattern.
+
+        Returns:
+            The rendered plot or None if there is no pending simulation result for the input pattern.
+        """
+        frame = self.pending_frames.pop(iteration, None)
+        if frame is None:
+            self.simulate_input_patterns([iteration])
+            return None
+
+        return self.visualizer.visualize_layout(
+            self.lyt, bb_min=self.min_pos, bb_max=self.max_pos, slider_value=iteration, **frame
+        )
+
     def get_slider_value(self) -> int:
         return self.slider_value
 
     def update_progress_bar(self, value: int) -> None:
-        # print(f"update_progress_bar called with value: {value}")  # Debugging statement
+        # setValue schedules a repaint of the progress bar on its own
         self.progress_bar.setValue(value)
-        QApplication.processEvents()  # Ensure the GUI updates
 
-    def simulation_finished(self) -> None:
-        self.progress_bar.setValue(0)  # Reset the progress bar
-        self.simulation_running = False  # Reset the simulation flag
+    def simulation_finished(self, simulation_thread: SimulationThread) -> None:
+        self.simulation_threads.remove(simulation_thread)
+        simulation_thread.deleteLater()
         QApplication.restoreOverrideCursor()  # Restore the cursor
+
+        if not self.simulation_threads:
+            self.progress_bar.setValue(0)  # Reset the progress bar
+            self.simulation_running = False  # Reset the simulation flag
         # print("Simulation finished. You can click again.")
 
     def picked_x_y(self) -> tuple[float, float]:
@@ -1,17 +1,35 @@
 from __future__ import annotations
 
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QCheckBox, QDoubleSpinBox, QHBoxLayout, QLabel, QSizePolicy, QVBoxLayout, QWidget
 
 from .info_tag import InfoTag
 
+# Help text of the log scale checkbox, shared by all range selectors
+_LOG_SCALE_TOOLTIP = (
+    "Use logarithmic axis scale instead of linear one. Logarithmic axes are not supported for 3D operational domain "
+    "plots."
+)
+
 
 class RangeSelector(QWidget):
+    # Emitted with the min, max, and step values whenever the range changed; set_range emits it only once
+    range_changed = pyqtSignal(float, float, float)
+
     def __init__(
         self, label_text: str, default_min: float, default_max: float, default_step: float, parent: QWidget = None
     ) -> None:
         super().__init__(parent)
         self._init_ui(label_text, default_min, default_max, default_step)
 
+        # Min, max, and step values; queried from the spinboxes once and invalidated whenever one of them changes
+        self._range: tuple[float, float, float] | None = None
+
+        # range_changed is emitted synchronously so that receivers (e.g., the log scale checkbox status) are up to date
+        # before the next user action is handled
+        for spinbox in (self.min_spinbox, self.max_spinbox, self.step_spinbox):
+            spinbox.valueChanged.connect(self._on_value_changed)
+
     def _init_ui(self, label_text: str, default_min: float, default_max: float, default_step: float) -> None:
         # Main layout for this custom widget
         layout = QVBoxLayout()
@@ -31,6 +49,7 @@ class RangeSelector(QWidget):
         self.min_spinbox.setSingleStep(0.5)
         self.min_spinbox.setValue(default_min)
         self.min_spinbox.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.min_spinbox.setKeyboardTracking(False)  # Only emit valueChanged once editing is finished
 
         spinbox_layout.addWidget(self.min_label)  # Add label to the horizontal layout
         spinbox_layout.addWidget(self.min_spinbox)  # Add spinbox to the horizontal layout
@@ -43,6 +62,7 @@ class RangeSelector(QWidget):
         self.max_spinbox.setSingleStep(0.5)
         self.max_spinbox.setValue(default_max)
         self.max_spinbox.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.max_spinbox.setKeyboardTracking(False)  # Only emit valueChanged once editing is finished
 
         spinbox_layout.addWidget(self.max_label)  # Add label to the horizontal layout
         spinbox_layout.addWidget(self.max_spinbox)  # Add spinbox to the horizontal layout
@@ -55,6 +75,7 @@ class RangeSelector(QWidget):
         self.step_spinbox.setSingleStep(0.01)
         self.step_spinbox.setValue(default_step)
         self.step_spinbox.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.step_spinbox.setKeyboardTracking(False)  # Only emit valueChanged once editing is finished
 
         spinbox_layout.addWidget(self.step_label)  # Add label to the horizontal layout
         spinbox_layout.addWidget(self.step_spinbox)  # Add spinbox to the horizontal layout
@@ -68,9 +89,7 @@ class RangeSelector(QWidget):
         spinbox_layout.addWidget(self.scale_checkbox)
 
         # Add help icon with tooltip
-        help_icon = InfoTag(
-            "Use logarithmic axis scale instead of linear one. Logarithmic axes are not supported for 3D operational domain plots."
-        )
+        help_icon = InfoTag(_LOG_SCALE_TOOLTIP)
         spinbox_layout.addWidget(help_icon)
 
         # Set the overall layout for the widget
@@ -79,6 +98,11 @@ class RangeSelector(QWidget):
     def set_range(
         self, min_value: float, max_value: float, min_step_value: float, max_step_value: float, step_value: float
     ) -> None:
+        # Reconfigure the spinboxes without emitting a valueChanged signal for every intermediate value
+        spinboxes = (self.min_spinbox, self.max_spinbox, self.step_spinbox)
+        for spinbox in spinboxes:
+            spinbox.blockSignals(True)
+
         self.min_spinbox.setRange(min_value, max_value)
         self.min_spinbox.setValue(min_value)
 
@@ -88,8 +112,20 @@ class RangeSelector(QWidget):
         self.step_spinbox.setRange(min_step_value, max_step_value)
         self.step_spinbox.setValue(step_value)
 
+        for spinbox in spinboxes:
+            spinbox.blockSignals(False)
+
+        # Announce the new range once instead
+        self._on_value_changed()
+
+    def _on_value_changed(self, _value: float | None = None) -> None:
+        self._range = None
+        self.range_changed.emit(*self.get_range())
+
     def get_range(self) -> tuple[float, float, float]:
-        return self.min_spinbox.value(), self.max_spinbox.value(), self.step_spinbox.value()
+        if self._range is None:
+            self._range = self.min_spinbox.value(), self.max_spinbox.value(), self.step_spinbox.value()
+        return self._range
 
     def set_single_steps(self, min_step: float, max_step: float, step_step: float) -> None:
         self.min_spinbox.setSingleStep(min_step)
@@ -105,7 +141,10 @@ class RangeSelector(QWidget):
         return self.scale_checkbox.isChecked()
 
     def disable_log_scale_checkbox(self) -> None:
+        # Unchecking is part of disabling the option and is thus not reported as a user toggle
+        self.scale_checkbox.blockSignals(True)
         self.scale_checkbox.setChecked(False)
+        self.scale_checkbox.blockSignals(False)
         self.scale_checkbox.setEnabled(False)
 
     def enable_log_scale_checkbox(self) -> None:
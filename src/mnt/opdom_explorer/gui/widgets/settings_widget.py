@@ -8,12 +8,15 @@ It provides getter functions to obtain the values of all settings selected by th
 
 from __future__ import annotations
 
+import re
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, ClassVar
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
-    QApplication,
     QButtonGroup,
     QComboBox,
     QDoubleSpinBox,
@@ -38,6 +41,35 @@ from .range_selector import RangeSelector
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+# Display names of the sweep parameters and the internal names they map to
+_DISPLAY_TO_INTERNAL: Mapping[str, str] = MappingProxyType({
+    "epsilon_r": "epsilon_r",
+    "lambda_TF [nm]": "lambda_TF",
+    "μ_ [eV]": "μ_",
+    "NONE": "NONE",
+})
+
+# Display names of the sweep parameters selectable in the X and Y dimension drop-downs
+_SWEEP_PARAMETERS = ("epsilon_r", "lambda_TF [nm]", "μ_ [eV]")
+
+# Sizes of the settings icon and the logos in the title bar
+_SETTINGS_ICON_SIZE = QSize(24, 24)
+_MNT_LOGO_SIZE = QSize(120, 55)
+_TUM_LOGO_SIZE = QSize(160, 55)
+
+# Selectable operational conditions; the first one is selected by default
+_OPERATIONAL_CONDITIONS = ("Tolerate Kinks", "Reject Kinks")
+
+# Help text of the operational condition radio buttons
+_OPERATIONAL_CONDITION_INFO = (
+    "Condition to decide if a layout is considered operational or non-operational at any given parameter point.\n"
+    "Tolerate Kinks: The layout is considered operational even if a wire exhibits kink states as long as the output BDL pair is in the correct logic state.\n"
+    "Reject Kinks: The layout is considered non-operational if any wire exhibits kink states."
+)
+
+# Recognized gate name that is separated by underscores from the rest of the file name (without extension)
+_GATE_NAME_PATTERN = re.compile(r"(?:^|_)(AND|OR|NAND|NOR|XOR|XNOR)(?=_|$)", re.IGNORECASE)
+
 
 class SettingsWidget(QWidget):
     """The SettingsWidget class provides a user interface for configuring all parameters of the operational domain
@@ -46,12 +78,7 @@ class SettingsWidget(QWidget):
     Z dimensions.
     """
 
-    DISPLAY_TO_INTERNAL: ClassVar[Mapping[str, str]] = {
-        "epsilon_r": "epsilon_r",
-        "lambda_TF [nm]": "lambda_TF",
-        "μ_ [eV]": "μ_",
-        "NONE": "NONE",
-    }
+    DISPLAY_TO_INTERNAL: ClassVar[Mapping[str, str]] = _DISPLAY_TO_INTERNAL
 
     def __init__(self, file_path: str) -> None:
         """Initializes the SettingsWidget. The user interface is created and all settings are initialized with default
@@ -63,6 +90,8 @@ class SettingsWidget(QWidget):
         super().__init__()
         self.file_path = Path(file_path)
         self.three_dimensional_sweep = False  # flag for 3D sweeps
+        # Sweep dimension drop-down and range selector of each direction, looked up by the sweep dimension slots
+        self._sweep_dimension_selectors: dict[str, tuple[QComboBox, RangeSelector]] = {}
 
         self._init_ui()
 
@@ -82,7 +111,7 @@ class SettingsWidget(QWidget):
         # Add the settings gear icon
         settings_icon_label = QLabel()
         cog_icon = self.icon_loader.load_settings_icon()
-        settings_icon_label.setPixmap(cog_icon.pixmap(24, 24))  # Set the icon size
+        settings_icon_label.setPixmap(cog_icon.pixmap(_SETTINGS_ICON_SIZE))  # Set the icon size
 
         # Add the title 'Settings'
         title_label = QLabel("Settings")
@@ -107,11 +136,11 @@ class SettingsWidget(QWidget):
 
         # Load the MNT logo and position it at the far right
         mnt_logo = self.icon_loader.load_mnt_logo()
-        mnt_logo.setFixedSize(120, 55)  # Set a fixed size for the logo
+        mnt_logo.setFixedSize(_MNT_LOGO_SIZE)  # Set a fixed size for the logo
 
         # Load the TUM logo and set a fixed size for it
         tum_logo = self.icon_loader.load_tum_logo()
-        tum_logo.setFixedSize(160, 55)  # Set fixed size for TUM logo
+        tum_logo.setFixedSize(_TUM_LOGO_SIZE)  # Set fixed size for TUM logo
 
         # Create a layout for the logos
         logo_layout = QHBoxLayout()
@@ -124,9 +153,6 @@ class SettingsWidget(QWidget):
         # Align the logo layout to the right
         title_bar_layout.addLayout(logo_layout)  # Add the logo layout to the right
 
-        # Set the layout on the title bar widget
-        title_bar_widget.setLayout(title_bar_layout)
-
         return title_bar_widget
 
     @staticmethod
@@ -142,27 +168,67 @@ class SettingsWidget(QWidget):
 
         return separator
 
+    @staticmethod
+    def _create_labeled_row(label_text: str, widget: QWidget, info_text: str | None = None) -> QHBoxLayout:
+        """Creates a row consisting of a label, the given widget, and optionally an info tag.
+
+        Args:
+            label_text (str): The text of the label.
+            widget (QWidget): The widget to place next to the label.
+            info_text (str | None, optional): The text displayed by the info tag. If None, no info tag is added and the
+                widget takes up its space instead.
+
+        Returns:
+            QHBoxLayout: The layout containing the label, the widget, and the info tag.
+        """
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(QLabel(label_text), 30)  # 30% of the space goes to the label
+        if info_text is None:
+            row_layout.addWidget(widget, 70)  # 70% of the space goes to the widget
+        else:
+            row_layout.addWidget(widget, 69)  # 69% of the space goes to the widget
+            row_layout.addWidget(InfoTag(info_text), 1)  # 1% of the space goes to the info tag
+
+        return row_layout
+
+    @staticmethod
+    def _create_parameter_spinbox(minimum: float, maximum: float, single_step: float, value: float) -> QDoubleSpinBox:
+        """Creates a double spinbox with two decimals for selecting the value of a physical simulation parameter.
+
+        Args:
+            minimum (float): The minimum selectable value.
+            maximum (float): The maximum selectable value.
+            single_step (float): The step size of the spinbox arrows.
+            value (float): The initial value.
+
+        Returns:
+            QDoubleSpinBox: The configured spinbox.
+        """
+        spinbox = QDoubleSpinBox()
+        spinbox.setRange(minimum, maximum)
+        spinbox.setDecimals(2)
+        spinbox.setSingleStep(single_step)
+        spinbox.setValue(value)
+
+        return spinbox
+
     def _create_engine_dropdown(self) -> QHBoxLayout:
         """Creates a drop-down widget for selecting the physical simulation engine.
 
         Returns:
             QComboBox: The drop-down widget for selecting the engine.
         """
-        engine_layout = QHBoxLayout()
-        engine_label = QLabel("Engine")
         self.engine_dropdown = QComboBox()
         self.engine_dropdown.addItems(["ExGS", "QuickExact", "QuickSim"])
         self.engine_dropdown.setCurrentIndex(1)  # Set QuickExact as default
-        engine_layout.addWidget(engine_label, 30)  # 30% of the space goes to the label
-        engine_layout.addWidget(self.engine_dropdown, 69)  # 69% of the space goes to the dropdown
-        engine_info_tag = InfoTag(
+
+        return self._create_labeled_row(
+            "Engine",
+            self.engine_dropdown,
             "Exhaustive Ground State Search (ExGS) is an exact but slow engine.\n"
             "QuickExact offers the same optimality guarantee as ExGS but has a runtime advantage of several orders of magnitude.\n"
-            "QuickSim is a fast but approximate engine that is best suited for small gates."
+            "QuickSim is a fast but approximate engine that is best suited for small gates.",
         )
-        engine_layout.addWidget(engine_info_tag, 1)  # 1% of the space goes to the info tag
-
-        return engine_layout
 
     def _create_epsilon_r_value_selector(self) -> QHBoxLayout:
         """Creates a double spinbox widget for selecting the epsilon_r value.
@@ -170,20 +236,10 @@ class SettingsWidget(QWidget):
         Returns:
             QHBoxLayout: The layout containing the epsilon_r value selector.
         """
-        epsilon_r_layout = QHBoxLayout()
-        epsilon_r_label = QLabel("epsilon_r")
-        self.epsilon_r_selector = QDoubleSpinBox()
-        self.epsilon_r_selector.setRange(1.0, 10.0)
-        self.epsilon_r_selector.setDecimals(2)
-        self.epsilon_r_selector.setSingleStep(0.1)
-        self.epsilon_r_selector.setValue(5.6)
+        self.epsilon_r_selector = self._create_parameter_spinbox(1.0, 10.0, 0.1, 5.6)
         self.epsilon_r_selector.setDisabled(True)  # Disable by default
-        epsilon_r_layout.addWidget(epsilon_r_label, 30)  # 30% of the space goes to the label
-        epsilon_r_layout.addWidget(self.epsilon_r_selector, 69)  # 69% of the space goes to the selector
-        epsilon_r_info_tag = InfoTag("epsilon_r is the dielectric constant.")
-        epsilon_r_layout.addWidget(epsilon_r_info_tag, 1)  # 1% of the space goes to the info tag
 
-        return epsilon_r_layout
+        return self._create_labeled_row("epsilon_r", self.epsilon_r_selector, "epsilon_r is the dielectric constant.")
 
     def _create_lambda_tf_value_selector(self) -> QHBoxLayout:
         """Creates a double spinbox widget for selecting the lambda_TF value.
@@ -191,20 +247,12 @@ class SettingsWidget(QWidget):
         Returns:
             QHBoxLayout: The layout containing the lambda_TF value selector.
         """
-        lambda_tf_layout = QHBoxLayout()
-        lambda_tf_label = QLabel("lambda_TF [nm]")
-        self.lambda_tf_selector = QDoubleSpinBox()
-        self.lambda_tf_selector.setRange(1.0, 10.0)
-        self.lambda_tf_selector.setDecimals(2)
-        self.lambda_tf_selector.setSingleStep(0.1)
-        self.lambda_tf_selector.setValue(5.0)
+        self.lambda_tf_selector = self._create_parameter_spinbox(1.0, 10.0, 0.1, 5.0)
         self.lambda_tf_selector.setDisabled(True)  # Disable by default
-        lambda_tf_layout.addWidget(lambda_tf_label, 30)  # 30% of the space goes to the label
-        lambda_tf_layout.addWidget(self.lambda_tf_selector, 69)  # 69% of the space goes to the selector
-        lambda_tf_info_tag = InfoTag("lambda_TF is the Thomas-Fermi screening length in nm.")
-        lambda_tf_layout.addWidget(lambda_tf_info_tag, 1)  # 1% of the space goes to the info tag
 
-        return lambda_tf_layout
+        return self._create_labeled_row(
+            "lambda_TF [nm]", self.lambda_tf_selector, "lambda_TF is the Thomas-Fermi screening length in nm."
+        )
 
     def _create_mu_minus_value_selector(self) -> QHBoxLayout:
         """Creates a double spinbox widget for selecting the μ_ value.
@@ -212,21 +260,13 @@ class SettingsWidget(QWidget):
         Returns:
             QHBoxLayout: The layout containing the μ_ value selector.
         """
-        mu_layout = QHBoxLayout()
-        mu_label = QLabel("μ_ [eV]")
-        self.mu_minus_selector = QDoubleSpinBox()
-        self.mu_minus_selector.setRange(-1.0, 1.0)
-        self.mu_minus_selector.setDecimals(2)
-        self.mu_minus_selector.setSingleStep(0.01)
-        self.mu_minus_selector.setValue(-0.28)
-        mu_layout.addWidget(mu_label, 30)  # 30% of the space goes to the label
-        mu_layout.addWidget(self.mu_minus_selector, 69)  # 69% of the space goes to the selector
-        mu_info_tag = InfoTag(
-            "μ_ is the energy difference between the Fermi Energy and the charge transition level (0/−) in eV."  # noqa: RUF001
-        )
-        mu_layout.addWidget(mu_info_tag, 1)  # 1% of the space goes to the info tag
+        self.mu_minus_selector = self._create_parameter_spinbox(-1.0, 1.0, 0.01, -0.28)
 
-        return mu_layout
+        return self._create_labeled_row(
+            "μ_ [eV]",
+            self.mu_minus_selector,
+            "μ_ is the energy difference between the Fermi Energy and the charge transition level (0/−) in eV.",  # noqa: RUF001
+        )
 
     def _create_physical_simulation_group(self) -> IconGroupBox:
         """Creates the physical simulation group containing settings for the physical simulation engine as well as μ_,
@@ -253,8 +293,6 @@ class SettingsWidget(QWidget):
         Returns:
             QHBoxLayout: The layout containing the Boolean function drop-down.
         """
-        boolean_function_layout = QHBoxLayout()
-        boolean_function_label = QLabel("Boolean Function")
         self.boolean_function_dropdown = QComboBox()
 
         # supported Boolean functions and their respective icons
@@ -267,16 +305,10 @@ class SettingsWidget(QWidget):
             "XNOR": self.icon_loader.load_xnor_gate_icon(),
         }
 
-        for name, icon in boolean_functions.items():
-            self.boolean_function_dropdown.addItem(icon, name)
-
-        boolean_function_layout.addWidget(boolean_function_label, 30)  # 30% of the space goes to the label
-        boolean_function_layout.addWidget(self.boolean_function_dropdown, 69)  # 69% of the space goes to the dropdown
-        boolean_function_info_tag = InfoTag(
-            "The Boolean function that the SiDB layout is expected to implement. "
-            "The operational domain plot will be generated based on this function."
-        )
-        boolean_function_layout.addWidget(boolean_function_info_tag, 1)  # 1% of the space goes to the info tag
+        # Insert all items into the model at once instead of one by one via addItem
+        boolean_function_model = QStandardItemModel(self.boolean_function_dropdown)
+        boolean_function_model.appendColumn([QStandardItem(icon, name) for name, icon in boolean_functions.items()])
+        self.boolean_function_dropdown.setModel(boolean_function_model)
 
         # Get the extracted Boolean function name
         extracted_function_name = self._extract_boolean_function_from_file_name()
@@ -290,7 +322,12 @@ class SettingsWidget(QWidget):
         else:
             self.boolean_function_dropdown.setCurrentIndex(0)  # Set 'AND' as default if extraction fails
 
-        return boolean_function_layout
+        return self._create_labeled_row(
+            "Boolean Function",
+            self.boolean_function_dropdown,
+            "The Boolean function that the SiDB layout is expected to implement. "
+            "The operational domain plot will be generated based on this function.",
+        )
 
     def _create_input_signal_perturber_radio_buttons(self) -> QHBoxLayout:
         """Creates radio buttons for selecting the input signal perturber encoding.
@@ -345,25 +382,20 @@ class SettingsWidget(QWidget):
         Returns:
             QHBoxLayout: The layout containing the algorithm drop-down.
         """
-        algorithm_layout = QHBoxLayout()
-        algorithm_label = QLabel("Algorithm")
         self.algorithm_dropdown = QComboBox()
         self.algorithm_dropdown.addItems(["Grid Search", "Random Sampling", "Flood Fill", "Contour Tracing"])
 
-        algorithm_layout.addWidget(algorithm_label, 30)  # 30% of the space goes to the label
-        algorithm_layout.addWidget(self.algorithm_dropdown, 69)  # 69% of the space goes to the dropdown
-        algorithm_info_tag = InfoTag(
+        # Connect the currentTextChanged signal of the algorithm_dropdown to the new slot method
+        self.algorithm_dropdown.currentTextChanged.connect(self._set_algorithm_specific_random_sample_count)
+
+        return self._create_labeled_row(
+            "Algorithm",
+            self.algorithm_dropdown,
             "Grid Search is a brute-force algorithm that evaluates all possible combinations of parameters. It recreates the entire operational domain within the parameter range.\n"
             "Random Sampling randomly samples from the parameter range and will (most likely) not recover the entire operational domain.\n"
             "Flood Fill is a seed-based algorithm that grows the operational domain from a randomly sampled seed. It will fully recreate all operational domain islands that were hit by the initial random samples.\n"
-            "Contour Tracing is also seed-based but aims at tracing only the edges of each operational domain island that was discovered by the initial random sampling."
+            "Contour Tracing is also seed-based but aims at tracing only the edges of each operational domain island that was discovered by the initial random sampling.",
         )
-        algorithm_layout.addWidget(algorithm_info_tag, 1)  # 1% of the space goes to the info tag
-
-        # Connect the currentTextChanged signal of the algorithm_dropdown to the new slot method
-        self.algorithm_dropdown.currentTextChanged.connect(self._set_algorithm_specific_random_sample_count)
-
-        return algorithm_layout
 
     def _create_random_samples_spinbox(self) -> QHBoxLayout:
         """Creates a spinbox widget for selecting the number of random samples.
@@ -371,21 +403,17 @@ class SettingsWidget(QWidget):
         Returns:
             QHBoxLayout: The layout containing the random samples spinbox.
         """
-        random_samples_layout = QHBoxLayout()
-        random_samples_label = QLabel("Random Samples")
         self.random_samples_spinbox = QSpinBox()
         self.random_samples_spinbox.setRange(0, 0)
         self.random_samples_spinbox.setValue(0)
         self.random_samples_spinbox.setDisabled(True)  # Disable by default
-        random_samples_layout.addWidget(random_samples_label, 30)  # 30% of the space goes to the label
-        random_samples_layout.addWidget(self.random_samples_spinbox, 69)  # 69% of the space goes to the spinbox
-        random_samples_info_tag = InfoTag(
+
+        return self._create_labeled_row(
+            "Random Samples",
+            self.random_samples_spinbox,
             "Number of random samples to take. If the Random Sampling algorithm is selected, this represents the total number of simulation samples to conduct. "
-            "If Flood Fill or Contour Tracing are selected however, this represents the number of random samples to take for the initial seed."
+            "If Flood Fill or Contour Tracing are selected however, this represents the number of random samples to take for the initial seed.",
         )
-        random_samples_layout.addWidget(random_samples_info_tag, 1)  # 1% of the space goes to the info tag
-
-        return random_samples_layout
 
     def _create_operational_condition_radio_buttons(self) -> QHBoxLayout:
         """Creates radio buttons for selecting the operational condition.
@@ -394,171 +422,68 @@ class SettingsWidget(QWidget):
             QHBoxLayout: The layout containing the radio
         """
         operational_condition_layout = QHBoxLayout()
-        operational_condition_label = QLabel("Operational Condition")
+        operational_condition_layout.addWidget(QLabel("Operational Condition"), 30)
 
         # Radio buttons
-        tolerate_kinks_radio = QRadioButton("Tolerate Kinks")
-        reject_kinks_radio = QRadioButton("Reject Kinks")
-
         self.operational_condition_group = QButtonGroup(self)
-        self.operational_condition_group.addButton(tolerate_kinks_radio)
-        self.operational_condition_group.addButton(reject_kinks_radio)
-
-        operational_condition_layout.addWidget(operational_condition_label, 30)
-        operational_condition_layout.addWidget(tolerate_kinks_radio, 34)
-        operational_condition_layout.addWidget(reject_kinks_radio, 34)
+        for operational_condition in _OPERATIONAL_CONDITIONS:
+            operational_condition_radio = QRadioButton(operational_condition)
+            self.operational_condition_group.addButton(operational_condition_radio)
+            operational_condition_layout.addWidget(operational_condition_radio, 34)
 
-        operational_condition_info_tag = InfoTag(
-            "Condition to decide if a layout is considered operational or non-operational at any given parameter point.\n"
-            "Tolerate Kinks: The layout is considered operational even if a wire exhibits kink states as long as the output BDL pair is in the correct logic state.\n"
-            "Reject Kinks: The layout is considered non-operational if any wire exhibits kink states."
-        )
-        operational_condition_layout.addWidget(
-            operational_condition_info_tag, 1
-        )  # 1% of the space goes to the info tag
+        # 1% of the space goes to the info tag
+        operational_condition_layout.addWidget(InfoTag(_OPERATIONAL_CONDITION_INFO), 1)
 
-        # Set default selection
-        tolerate_kinks_radio.setChecked(True)  # Set default option if desired
+        # Set default selection ('Tolerate Kinks')
+        self.operational_condition_group.buttons()[0].setChecked(True)
 
         return operational_condition_layout
 
-    def _create_x_dimension_drop_down(self) -> QHBoxLayout:
-        """Creates a drop-down for selecting the sweep dimension in X direction.
-
-        Returns:
-             QHBoxLayout: The layout containing the X dimension drop-down.
-        """
-        x_dimension_layout = QHBoxLayout()
-        x_dimension_label = QLabel("X-Dimension")
-
-        self.x_dimension_dropdown = QComboBox()
-        self.x_dimension_dropdown.addItems(["epsilon_r", "lambda_TF [nm]", "μ_ [eV]"])
-        x_dimension_layout.addWidget(x_dimension_label, 30)
-        x_dimension_layout.addWidget(self.x_dimension_dropdown, 70)
-
-        # Set the parameter range selector based on the selected sweep dimension
-        self.x_dimension_dropdown.currentIndexChanged.connect(
-            lambda: self._set_dimension_specific_parameter_range(
-                self.x_dimension_dropdown.currentText(), self.x_parameter_range_selector
-            )
-        )
-
-        return x_dimension_layout
-
-    def _create_x_dimension_range_selector(self) -> RangeSelector:
-        """Creates the range selector for the X parameter range that enables selecting the desired sweep values.
-
-        Returns:
-             RangeSelector: The X dimension range selector.
-        """
-        self.x_parameter_range_selector = RangeSelector("X-Parameter Range", 0.0, 10.0, 0.1)
-
-        self.x_parameter_range_selector.min_spinbox.valueChanged.connect(
-            lambda: self._set_parameter_range_specific_log_scale_checkbox_status(self.x_parameter_range_selector)
-        )
-        self.x_parameter_range_selector.max_spinbox.valueChanged.connect(
-            lambda: self._set_parameter_range_specific_log_scale_checkbox_status(self.x_parameter_range_selector)
-        )
-
-        return self.x_parameter_range_selector
-
-    def _create_y_dimension_drop_down(self) -> QHBoxLayout:
-        """Creates a drop-down for selecting the sweep dimension in Y direction.
-
-        Returns:
-             QHBoxLayout: The layout containing the Y dimension drop-down.
-        """
-        y_dimension_layout = QHBoxLayout()
-        y_dimension_label = QLabel("Y-Dimension")
-
-        self.y_dimension_dropdown = QComboBox()
-        self.y_dimension_dropdown.addItems(["epsilon_r", "lambda_TF [nm]", "μ_ [eV]"])
-        self.y_dimension_dropdown.setCurrentIndex(1)  # set lambda_TF as default
-        y_dimension_layout.addWidget(y_dimension_label, 30)
-        y_dimension_layout.addWidget(self.y_dimension_dropdown, 70)
-
-        # Set the parameter range selector based on the selected sweep dimension
-        self.y_dimension_dropdown.currentIndexChanged.connect(
-            lambda: self._set_dimension_specific_parameter_range(
-                self.y_dimension_dropdown.currentText(), self.y_parameter_range_selector
-            )
-        )
-
-        return y_dimension_layout
+    @staticmethod
+    def _create_sweep_dimension_dropdown(display_names: tuple[str, ...]) -> QComboBox:
+        """Creates a drop-down for selecting a sweep dimension. Each item carries the internal name of its sweep
+        parameter as item data, which is thus available via currentData() without a lookup.
 
-    def _create_y_dimension_range_selector(self) -> RangeSelector:
-        """Creates the range selector for the Y parameter range that enables selecting the desired sweep values.
+        Args:
+            display_names (Tuple[str, ...]): The display names of the selectable sweep parameters.
 
         Returns:
-             RangeSelector: The Y dimension range selector.
+            QComboBox: The sweep dimension drop-down.
         """
-        self.y_parameter_range_selector = RangeSelector("Y-Parameter Range", 0.0, 10.0, 0.1)
+        dropdown = QComboBox()
+        for display_name in display_names:
+            dropdown.addItem(display_name, _DISPLAY_TO_INTERNAL[display_name])
 
-        self.y_parameter_range_selector.min_spinbox.valueChanged.connect(
-            lambda: self._set_parameter_range_specific_log_scale_checkbox_status(self.y_parameter_range_selector)
-        )
-        self.y_parameter_range_selector.max_spinbox.valueChanged.connect(
-            lambda: self._set_parameter_range_specific_log_scale_checkbox_status(self.y_parameter_range_selector)
-        )
+        return dropdown
 
-        return self.y_parameter_range_selector
+    def _create_sweep_dimension_selectors(
+        self, axis: str, display_names: tuple[str, ...], default_index: int = 0
+    ) -> tuple[QComboBox, QHBoxLayout, RangeSelector]:
+        """Creates the drop-down for selecting the sweep dimension in the given direction and the range selector that
+        enables selecting the desired sweep values of the selected parameter.
 
-    def _create_z_dimension_drop_down(self) -> QHBoxLayout:
-        """Creates a drop-down for selecting the sweep dimension in Z direction.
+        Args:
+            axis (str): The name of the direction, e.g., 'X'.
+            display_names (Tuple[str, ...]): The display names of the selectable sweep parameters.
+            default_index (int, optional): The index of the sweep parameter that is selected by default.
 
         Returns:
-             QHBoxLayout: The layout containing the Z dimension drop-down.
+            Tuple[QComboBox, QHBoxLayout, RangeSelector]: The drop-down, the layout containing the drop-down, and the
+            range selector.
         """
-        # Z-Dimension sweep parameter drop-down (Initially set to NONE)
-        z_dimension_layout = QHBoxLayout()
-        z_dimension_label = QLabel("Z-Dimension")
+        dropdown = self._create_sweep_dimension_dropdown(display_names)
+        dropdown.setCurrentIndex(default_index)
+        dimension_layout = self._create_labeled_row(f"{axis}-Dimension", dropdown)
 
-        self.z_dimension_dropdown = QComboBox()
-        self.z_dimension_dropdown.addItems(["NONE", "epsilon_r", "lambda_TF [nm]", "μ_ [eV]"])
-        z_dimension_layout.addWidget(z_dimension_label, 30)
-        z_dimension_layout.addWidget(self.z_dimension_dropdown, 70)
+        range_selector = RangeSelector(f"{axis}-Parameter Range", 0.0, 10.0, 0.1)
+        self._sweep_dimension_selectors[axis] = dropdown, range_selector
 
         # Set the parameter range selector based on the selected sweep dimension
-        self.z_dimension_dropdown.currentIndexChanged.connect(
-            lambda: self._set_dimension_specific_parameter_range(
-                self.z_dimension_dropdown.currentText(), self.z_parameter_range_selector
-            )
-        )
-        # Disable contour tracing if 3D sweeps are selected
-        self.z_dimension_dropdown.currentIndexChanged.connect(
-            lambda: self._set_dimension_specific_algorithm_selector(self.z_dimension_dropdown.currentText())
-        )
-        # Disable log scale if 3D sweeps are selected
-        self.z_dimension_dropdown.currentIndexChanged.connect(
-            lambda: self._set_algorithm_specific_log_scale_checkbox_status(
-                self.z_dimension_dropdown.currentText(),
-                [
-                    self.x_parameter_range_selector,
-                    self.y_parameter_range_selector,
-                    # self.z_parameter_range_selector # TODO uncomment for 3D log scale
-                ],
-            )
-        )
+        dropdown.currentIndexChanged.connect(partial(self._on_sweep_dimension_changed, axis))
+        # Disable the log scale checkbox if the range is not fully positive
+        range_selector.range_changed.connect(partial(self._on_sweep_range_changed, axis))
 
-        return z_dimension_layout
-
-    def _create_z_dimension_range_selector(self) -> RangeSelector:
-        """Creates the range selector for the Z parameter range that enables selecting the desired sweep values.
-
-        Returns:
-             RangeSelector: The Z dimension range selector.
-        """
-        self.z_parameter_range_selector = RangeSelector("Z-Parameter Range", 0.0, 10.0, 0.1)
-        self.z_parameter_range_selector.setDisabled(True)  # Initially disabled
-
-        self.z_parameter_range_selector.min_spinbox.valueChanged.connect(
-            lambda: self._set_parameter_range_specific_log_scale_checkbox_status(self.z_parameter_range_selector)
-        )
-        self.z_parameter_range_selector.max_spinbox.valueChanged.connect(
-            lambda: self._set_parameter_range_specific_log_scale_checkbox_status(self.z_parameter_range_selector)
-        )
-
-        return self.z_parameter_range_selector
+        return dropdown, dimension_layout, range_selector
 
     def _create_sweep_settings_sub_group(self) -> QGroupBox:
         """Creates the sweep settings sub-group containing settings for the sweep parameters in X, Y, and Z dimension.
@@ -568,28 +493,39 @@ class SettingsWidget(QWidget):
         """
         # Operational Domain Sweep Sub-group
         self.operational_domain_sweep_group = QGroupBox("Sweep Settings")
-        operational_domain_sweep_layout = QVBoxLayout()  # Layout for sweep settings
+        # Layout for sweep settings, installed on the sub-group right away
+        operational_domain_sweep_layout = QVBoxLayout(self.operational_domain_sweep_group)
 
         # X Dimension
-        operational_domain_sweep_layout.addLayout(self._create_x_dimension_drop_down())
-        operational_domain_sweep_layout.addWidget(self._create_x_dimension_range_selector())
+        self.x_dimension_dropdown, x_dimension_layout, self.x_parameter_range_selector = (
+            self._create_sweep_dimension_selectors("X", _SWEEP_PARAMETERS)
+        )
+        operational_domain_sweep_layout.addLayout(x_dimension_layout)
+        operational_domain_sweep_layout.addWidget(self.x_parameter_range_selector)
 
-        # Y Dimension
-        operational_domain_sweep_layout.addLayout(self._create_y_dimension_drop_down())
-        operational_domain_sweep_layout.addWidget(self._create_y_dimension_range_selector())
+        # Y Dimension (lambda_TF by default)
+        self.y_dimension_dropdown, y_dimension_layout, self.y_parameter_range_selector = (
+            self._create_sweep_dimension_selectors("Y", _SWEEP_PARAMETERS, default_index=1)
+        )
+        operational_domain_sweep_layout.addLayout(y_dimension_layout)
+        operational_domain_sweep_layout.addWidget(self.y_parameter_range_selector)
+
+        # Z Dimension (initially set to NONE)
+        self.z_dimension_dropdown, z_dimension_layout, self.z_parameter_range_selector = (
+            self._create_sweep_dimension_selectors("Z", ("NONE", *_SWEEP_PARAMETERS))
+        )
+        self.z_parameter_range_selector.setDisabled(True)  # Initially disabled
+        operational_domain_sweep_layout.addLayout(z_dimension_layout)
+        operational_domain_sweep_layout.addWidget(self.z_parameter_range_selector)
 
-        # Z Dimension
-        operational_domain_sweep_layout.addLayout(self._create_z_dimension_drop_down())
-        operational_domain_sweep_layout.addWidget(self._create_z_dimension_range_selector())
+        # Disable contour tracing and log scale if 3D sweeps are selected
+        self.z_dimension_dropdown.currentIndexChanged.connect(self._on_z_dimension_changed)
 
         # Connect the sweep dimension selectors to the set_sweep_specific_simulation_parameter_selectors method
         self.x_dimension_dropdown.currentIndexChanged.connect(self._set_sweep_specific_simulation_parameter_selectors)
         self.y_dimension_dropdown.currentIndexChanged.connect(self._set_sweep_specific_simulation_parameter_selectors)
         self.z_dimension_dropdown.currentIndexChanged.connect(self._set_sweep_specific_simulation_parameter_selectors)
 
-        # Set the layout for the 'Sweep Settings' sub-group
-        self.operational_domain_sweep_group.setLayout(operational_domain_sweep_layout)
-
         return self.operational_domain_sweep_group
 
     def _create_operational_domain_group(self) -> IconGroupBox:
@@ -619,10 +555,8 @@ class SettingsWidget(QWidget):
         self.scroll_widget = QWidget()
         self.scroll_container_layout = QVBoxLayout(self.scroll_widget)
 
-        # Create the main settings widget and layout
-        self.settings_widget = QWidget()
-        self.settings_layout = QVBoxLayout()
-        self.settings_widget.setLayout(self.settings_layout)
+        # Create the main settings layout directly on this widget
+        self.settings_layout = QVBoxLayout(self)
 
         # Add the title bar widget to the settings layout
         self.settings_layout.addWidget(self._create_title_bar())
@@ -660,11 +594,6 @@ class SettingsWidget(QWidget):
         # Set the icon on the 'Run' button
         self.run_button.setIcon(play_icon)
 
-        # Layout for the whole widget
-        layout = QVBoxLayout(self)
-        layout.addWidget(self.settings_widget)
-        self.setLayout(layout)
-
     def _extract_boolean_function_from_file_name(self) -> str | None:
         """Tries to extract the Boolean function from the file name. The function name is expected to be separated by an
         underscore from the rest of the file name.
@@ -673,21 +602,49 @@ class SettingsWidget(QWidget):
             str | None: The extracted Boolean function name. Or None if no recognized gate name is found.
         """
         # Get the file name without the extension
-        base_name = self.file_path.name.split(".")[0]
-        # Define recognized gate names
-        recognized_gates = ["AND", "OR", "NAND", "NOR", "XOR", "XNOR"]
+        base_name = self.file_path.name.partition(".")[0]
 
-        # Split the base name by '_'
-        parts = base_name.split("_")
+        # Search for the first recognized gate name
+        match = _GATE_NAME_PATTERN.search(base_name)
 
-        # Check each part for a recognized gate name
-        for part in parts:
-            # Convert to uppercase and check if it's a recognized gate
-            gate_name = part.upper()
-            if gate_name in recognized_gates:
-                return gate_name  # Return the first recognized gate name
+        return match.group(1).upper() if match else None  # Return None if no recognized gate is found
 
-        return None  # Return None if no recognized gate is found
+    def _on_sweep_dimension_changed(self, axis: str, _index: int) -> None:
+        """Adjusts the range selector of the given direction to the newly selected sweep parameter.
+
+        Args:
+            axis (str): The direction whose sweep dimension drop-down changed, e.g., 'X'.
+            _index (int): The new index of the drop-down (unused).
+        """
+        dropdown, range_selector = self._sweep_dimension_selectors[axis]
+        self._set_dimension_specific_parameter_range(dropdown.currentData(), range_selector)
+
+    def _on_sweep_range_changed(self, axis: str, *_range: float) -> None:
+        """Updates the log scale checkbox status of the range selector of the given direction after its range changed.
+
+        Args:
+            axis (str): The direction whose range selector changed, e.g., 'X'.
+            *_range (float): The new min, max, and step values (unused).
+        """
+        _, range_selector = self._sweep_dimension_selectors[axis]
+        self._set_parameter_range_specific_log_scale_checkbox_status(range_selector)
+
+    def _on_z_dimension_changed(self, _index: int) -> None:
+        """Disables contour tracing and the log scale checkboxes if a 3D sweep is selected and re-enables them otherwise.
+
+        Args:
+            _index (int): The new index of the Z dimension drop-down (unused).
+        """
+        selected_sweep_parameter = self.z_dimension_dropdown.currentData()
+        self._set_dimension_specific_algorithm_selector(selected_sweep_parameter)
+        self._set_algorithm_specific_log_scale_checkbox_status(
+            selected_sweep_parameter,
+            [
+                self.x_parameter_range_selector,
+                self.y_parameter_range_selector,
+                # self.z_parameter_range_selector # TODO uncomment for 3D log scale
+            ],
+        )
 
     def _set_sweep_specific_simulation_parameter_selectors(self) -> None:
         """Disables the respective base simulation parameter selector based on the currently active sweep parameters. E.g.,
@@ -695,27 +652,17 @@ class SettingsWidget(QWidget):
         any sweep dimension selector, it is re-enabled. Analogously for 'lambda_TF [nm]' and 'μ_ [eV]'.
         """
         # Get the internal values of all selected sweep dimensions
-        sweep_drop_down_values = [
-            self.DISPLAY_TO_INTERNAL[self.x_dimension_dropdown.currentText()],
-            self.DISPLAY_TO_INTERNAL[self.y_dimension_dropdown.currentText()],
-            self.DISPLAY_TO_INTERNAL[self.z_dimension_dropdown.currentText()],
-        ]
-
-        # Disable the base simulation parameter selectors if they are selected in any sweep dimension
-        if "epsilon_r" in sweep_drop_down_values:
-            self.epsilon_r_selector.setDisabled(True)
-        if "lambda_TF" in sweep_drop_down_values:
-            self.lambda_tf_selector.setDisabled(True)
-        if "μ_" in sweep_drop_down_values:
-            self.mu_minus_selector.setDisabled(True)
-
-        # Re-enable the base simulation parameter selectors if they are not selected in any sweep dimension
-        if "epsilon_r" not in sweep_drop_down_values:
-            self.epsilon_r_selector.setEnabled(True)
-        if "lambda_TF" not in sweep_drop_down_values:
-            self.lambda_tf_selector.setEnabled(True)
-        if "μ_" not in sweep_drop_down_values:
-            self.mu_minus_selector.setEnabled(True)
+        sweep_drop_down_values = {
+            self.x_dimension_dropdown.currentData(),
+            self.y_dimension_dropdown.currentData(),
+            self.z_dimension_dropdown.currentData(),
+        }
+
+        # Disable the base simulation parameter selectors if they are selected in any sweep dimension and re-enable
+        # them otherwise
+        self.epsilon_r_selector.setDisabled("epsilon_r" in sweep_drop_down_values)
+        self.lambda_tf_selector.setDisabled("lambda_TF" in sweep_drop_down_values)
+        self.mu_minus_selector.setDisabled("μ_" in sweep_drop_down_values)
 
     def _set_algorithm_specific_random_sample_count(self, selected_algorithm: str) -> None:
         """Sets the range and step size of the random samples spinbox based on the selected operational domain algorithm.
@@ -766,14 +713,14 @@ class SettingsWidget(QWidget):
     @staticmethod
     def _set_dimension_specific_parameter_range(selected_sweep_parameter: str, range_selector: RangeSelector) -> None:
         """Sets the range and step size of the given range selector based on the selected sweep parameter.
-        For 'μ_ [eV]', the range is set to (-0.5, -0.1) with a step size of 0.01. For all other parameters, the range
+        For 'μ_', the range is set to (-0.5, -0.1) with a step size of 0.01. For all other parameters, the range
         is set to (0.0, 10.0) with a step size of 0.5. If 'NONE' is selected, the range selector is disabled.
 
         Args:
-            selected_sweep_parameter (str): The selected sweep parameter from the dimension dropdown.
+            selected_sweep_parameter (str): The internal name of the selected sweep parameter from the dimension dropdown.
             range_selector (RangeSelector): The range selector to set the range for.
         """
-        if selected_sweep_parameter == "μ_ [eV]":
+        if selected_sweep_parameter == "μ_":
             range_selector.set_range(-0.5, -0.1, 0.0001, 0.1, 0.005)
             range_selector.set_single_steps(0.01, 0.01, 0.001)
             range_selector.set_decimal_precision(2, 2, 3)
@@ -820,12 +767,10 @@ class SettingsWidget(QWidget):
     def disable_run_button(self) -> None:
         """Disables the 'Run Simulation' button."""
         self.run_button.setDisabled(True)
-        QApplication.processEvents()  # Force GUI update
 
     def enable_run_button(self) -> None:
         """Enables the 'Run Simulation' button."""
         self.run_button.setEnabled(True)
-        QApplication.processEvents()  # Force GUI update
 
     def get_simulation_engine(self) -> str:
         """Retrieves the selected physical simulation engine.
@@ -911,7 +856,7 @@ class SettingsWidget(QWidget):
         Returns:
             str: The selected sweep dimension in X direction.
         """
-        return self.DISPLAY_TO_INTERNAL.get(self.x_dimension_dropdown.currentText())
+        return self.x_dimension_dropdown.currentData()
 
     def get_x_parameter_range(self) -> tuple[float, float, float]:
         """Retrieves the selected X parameter range as a tuple of (min, max, step).
@@ -935,7 +880,7 @@ class SettingsWidget(QWidget):
         Returns:
             str: The selected sweep dimension in Y direction.
         """
-        return self.DISPLAY_TO_INTERNAL.get(self.y_dimension_dropdown.currentText())
+        return self.y_dimension_dropdown.currentData()
 
     def get_y_parameter_range(self) -> tuple[float, float, float]:
         """Retrieves the selected Y parameter range as a tuple of (min, max, step).
@@ -959,7 +904,7 @@ class SettingsWidget(QWidget):
         Returns:
             str: The selected sweep dimension in Z direction.
         """
-        return self.DISPLAY_TO_INTERNAL.get(self.z_dimension_dropdown.currentText())
+        return self.z_dimension_dropdown.currentData()
 
     def get_z_parameter_range(self) -> tuple[float, float, float]:
         """Retrieves the selected Z parameter range as a tuple of (min, max, step).
@@ -72,6 +72,15 @@ class TestPlotFunctions(unittest.TestCase):
         assert (operational_data[0]["operational status"] == 1).all()
         assert (non_operational_data[0]["operational status"] == 0).all()
 
+    def test_load_data_from_buffer(self) -> None:
+        """Test the load_data function with an in-memory CSV buffer instead of a file path."""
+        csv_buffer = io.StringIO(Path(self.csv_file_path).read_text(encoding="utf-8"))
+        operational_data, non_operational_data = load_data([csv_buffer])
+
+        assert len(operational_data[0]) + len(non_operational_data[0]) == self.df.shape[0]
+        assert (operational_data[0]["operational status"] == 1).all()
+        assert (non_operational_data[0]["operational status"] == 0).all()
+
     def test_extract_parameters(self) -> None:
         """Test the extract_parameters function for correct extraction of parameters."""
         x_data, y_data, z_data = extract_parameters([self.df], "epsilon_r", "lambda_tf", "mu_minus")